@@ -2,6 +2,7 @@ from fastapi import Depends
 from typing import Annotated
 
 from src.core.di.container import container
+from src.core.mcp import MCPServer
 from src.core.orchestration import IntelligentRouter
 from src.core.plugin.manager import PluginManager
 from src.core.tasks import TaskHandler
@@ -29,6 +30,11 @@ def get_ai_manager() -> AIManager:
     return container.get(AIManager)
 
 
+def get_mcp_server() -> MCPServer:
+    """获取MCP服务"""
+    return container.get(MCPServer)
+
+
 def get_intelligent_plugin_router() -> IntelligentRouter:
     """获取智能插件路由器"""
     return container.get(IntelligentRouter)
@@ -40,3 +46,4 @@ TaskHandlerDep = Annotated[TaskHandler, Depends(get_task_service)]
 DataBaseManagerDep = Annotated[DataBaseManager, Depends(get_database_manager)]
 AIManagerDep = Annotated[AIManager, Depends(get_ai_manager)]
 IntelligentRouterDep = Annotated[IntelligentRouter, Depends(get_intelligent_plugin_router)]
+MCPServerDep = Annotated[MCPServer, Depends(get_mcp_server)]
@@ -1,8 +1,8 @@
 from typing import Dict, List, Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
-from src.api.dependencies import PluginManagerDep
+from src.api.dependencies import PluginManagerDep, MCPServerDep
 from src.api.models import APIResponse
 from src.core.config import get_logger
 from src.core.plugin.model import PluginRegistration
@@ -66,3 +66,14 @@ async def get_tool_details(tool_id: str, plugin_manager: PluginManagerDep):
             "metadata": plugin.metadata
         })
     return APIResponse.ok()
+
+
+@router.post("/rpc", summary="JSON-RPC 2.0 endpoint (single or batch).", response_model=None)
+async def rpc(request: Request, mcp_server: MCPServerDep) -> Response:
+    """
+    Call plugin functions via JSON-RPC; a JSON array body is handled as a batch.
+    """
+    body = await mcp_server.handle(await request.body())
+    if body is None:
+        return Response(status_code=204)
+    return Response(content=body, media_type="application/json")
@@ -1,4 +1,18 @@
 # Core Package
-from .app import create_app
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import create_app
+
+
+def __getattr__(name: str):
+    # create_app 在首次访问时才导入（PEP 562），导入 src.core 下的子包不会连带加载整个应用
+    if name != "create_app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(".app", __name__).create_app
+    globals()[name] = value
+    return value
+
 
 __all__ = ["create_app"]
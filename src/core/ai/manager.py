@@ -1,7 +1,7 @@
 # AI Manager Module
 import asyncio
 import datetime
-from typing import List, Dict, Optional, Any, Type
+from typing import List, Dict, Optional, Any, Tuple, Type
 
 from src.core.ai.model import AIProviderMap
 from src.core.ai.providers.interface import BaseAIProvider
@@ -21,6 +21,8 @@ class AIManager:
         self._providers: Dict[str, BaseAIProvider] = {}
         self.primary_provider: Optional[str] = None
         self.fallback_providers: List[str] = []
+        # In-flight calls keyed by (system_prompt, user_prompt, kwargs); identical concurrent calls share one request
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
 
         self._provider_map = AIProviderMap()
         self.__initialize_providers()
@@ -71,7 +73,28 @@ class AIManager:
                                  system_prompt: str,
                                  user_prompt: str,
                                  **kwargs) -> SelectionResponse:
-        """Call provider with fallback mechanism"""
+        """Call provider with fallback mechanism
+
+        Identical calls issued while one is still in flight await the same request
+        instead of sending another one to the provider.
+        """
+        key = (system_prompt, user_prompt, tuple(sorted(kwargs.items())))
+        try:
+            task = self._inflight.get(key)
+        except TypeError:
+            # Unhashable kwargs (e.g. stop=[...], tools=[...]) cannot be coalesced; call through
+            return await self._call_with_fallback(system_prompt, user_prompt, **kwargs)
+        if task is None:
+            task = asyncio.ensure_future(self._call_with_fallback(system_prompt, user_prompt, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the request the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _call_with_fallback(self,
+                                  system_prompt: str,
+                                  user_prompt: str,
+                                  **kwargs) -> SelectionResponse:
         providers_to_try = [self.primary_provider] + self.fallback_providers
         last_exception = None
 
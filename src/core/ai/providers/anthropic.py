@@ -1,6 +1,6 @@
 # Anthropic Provider Module
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import httpx
 
@@ -12,6 +12,7 @@ LOGGER = get_logger(__name__)
 
 
 class AnthropicProvider(BaseAIProvider, ABC):
+    SUPPORTS_STREAMING = True
 
     def __init__(self, config: AIConfig):
         super().__init__(config)
@@ -71,6 +72,17 @@ class AnthropicProvider(BaseAIProvider, ABC):
         """
         return response_data["content"][0]["text"]
 
+    def _extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the text delta from an Anthropic streaming event.
+
+        :param event: The decoded event data.
+        :return: The text fragment, or None for non-content events.
+        """
+        if event.get("type") == "content_block_delta":
+            return event.get("delta", {}).get("text")
+        return None
+
     def get_default_model(self) -> str:
         """
         Get the default model for the Anthropic API.
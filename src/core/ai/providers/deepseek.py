@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import requests
 
@@ -9,6 +9,7 @@ from src.core.config.models import AIProviderEnum
 
 
 class DeepSeekProvider(BaseAIProvider, ABC):
+    SUPPORTS_STREAMING = True
 
     def __init__(self, config):
         super().__init__(config)
@@ -36,6 +37,10 @@ class DeepSeekProvider(BaseAIProvider, ABC):
     def _extract_response_content(self, response_data: Dict[str, Any]) -> str:
         return response_data["choices"][0]["message"]["content"]
 
+    def _extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        choices = event.get("choices")
+        return choices[0].get("delta", {}).get("content") if choices else None
+
     def get_default_model(self) -> str:
         return self.config.default_model
 
@@ -6,16 +6,29 @@ import httpx
 from src.core.ai.providers.response import SelectionResponse
 from src.core.config import get_logger
 from src.core.config.models import AIConfig
-from src.core.utils import JsonValidator
+from src.core.utils import JsonValidator, json_loads
 from src.core.utils.common_utils import project_root
 from src.core.utils.template import EnhancedPromptTemplates, PromptResponse
 
 LOGGER = get_logger(__name__)
 
+# JSON 修复模板共享一个渲染器，避免每次修复都重新读取模板文件
+_json_fix_templates: Optional[EnhancedPromptTemplates] = None
+
+
+def _get_json_fix_templates() -> EnhancedPromptTemplates:
+    global _json_fix_templates
+    if _json_fix_templates is None:
+        _json_fix_templates = EnhancedPromptTemplates(template_dir=f"{project_root()}/templates/prompts")
+    return _json_fix_templates
+
 
 class BaseAIProvider(ABC):
     """Base class for AI providers with common interface and functionality"""
 
+    # Whether the provider implements _extract_stream_delta for SSE responses
+    SUPPORTS_STREAMING = False
+
     def __init__(self, config: AIConfig):
         """Initialize AI provider with configuration
 
@@ -62,6 +75,17 @@ class BaseAIProvider(ABC):
         """
         pass
 
+    def _extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text delta from a single streamed event
+
+        Args:
+            event: Decoded JSON payload of one SSE data line
+
+        Returns:
+            Text fragment, or None if the event carries no content
+        """
+        return None
+
     @abstractmethod
     def _get_api_endpoint(self) -> str:
         """Get the API endpoint for this provider
@@ -132,6 +156,12 @@ class BaseAIProvider(ABC):
         timeout = self.get_timeout_config()
         endpoint = f"{self.base_url}{self._get_api_endpoint()}"
 
+        if self.SUPPORTS_STREAMING and getattr(self.config, 'stream', False):
+            content = await self._make_streaming_ai_request(endpoint, headers, payload, timeout)
+            self.add_to_conversation("user", self.user_prompt)
+            self.add_to_conversation("assistant", content)
+            return content
+
         async with httpx.AsyncClient(timeout=timeout) as client:
             LOGGER.debug(f"Requesting: {endpoint}")
             LOGGER.debug(f"Model: {model}")
@@ -151,6 +181,42 @@ class BaseAIProvider(ABC):
                 error_msg = self._extract_error_message(response)
                 raise Exception(f"{self.__class__.__name__} API Error {response.status_code}: {error_msg}")
 
+    async def _make_streaming_ai_request(self, endpoint: str, headers: Dict[str, str],
+                                         payload: Dict[str, Any], timeout: 'httpx.Timeout') -> str:
+        """
+        Make an AI request with stream=True and accumulate the streamed deltas
+
+        The read timeout applies per chunk instead of to the whole generation,
+        so long execution plans no longer time out while still being produced.
+
+        Returns:
+            Full response content
+
+        Raises:
+            Exception: If API request fails
+        """
+        parts: List[str] = []
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            async with client.stream("POST", endpoint, headers=headers, json={**payload, "stream": True}) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    error_msg = self._extract_error_message(response)
+                    raise Exception(f"{self.__class__.__name__} API Error {response.status_code}: {error_msg}")
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    if not data:
+                        continue
+                    delta = self._extract_stream_delta(json_loads(data))
+                    if delta:
+                        parts.append(delta)
+
+        return "".join(parts)
+
     async def get_completion(self, model: Optional[str] = None) -> SelectionResponse:
         """Get completion from AI model
 
@@ -175,8 +241,7 @@ class BaseAIProvider(ABC):
             return content
         else:
 
-            enhancedPromptTemplates = EnhancedPromptTemplates(template_dir=f"{project_root()}/templates/prompts")
-            prompt: PromptResponse = enhancedPromptTemplates.get_json_fix_prompt(invalid_json=content)
+            prompt: PromptResponse = _get_json_fix_templates().get_json_fix_prompt(invalid_json=content)
             self.set_prompts(prompt.system_prompt, prompt.user_prompt)
             return await self._make_ai_request(model=model)
 
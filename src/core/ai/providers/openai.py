@@ -1,6 +1,6 @@
 # OpenAI Provider Module
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from src.core.ai.providers.interface import BaseAIProvider
 from src.core.config.ai import AiConfigLoader
@@ -12,6 +12,7 @@ LOGGER = get_logger(__name__)
 
 
 class OpenAIProvider(BaseAIProvider, ABC):
+    SUPPORTS_STREAMING = True
 
     def __init__(self, config: AIConfig):
         super().__init__(config)
@@ -39,6 +40,10 @@ class OpenAIProvider(BaseAIProvider, ABC):
     def _extract_response_content(self, response_data: Dict[str, Any]) -> str:
         return response_data["choices"][0]["message"]["content"]
 
+    def _extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        choices = event.get("choices")
+        return choices[0].get("delta", {}).get("content") if choices else None
+
     def get_default_model(self) -> str:
         return self.config.default_model
 
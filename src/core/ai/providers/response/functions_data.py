@@ -2,6 +2,8 @@ import json
 from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional
 
+from src.core.utils.json_utils import json_loads
+
 
 @dataclass
 class FunctionSelection:
@@ -48,8 +50,17 @@ class ExecutionPlan:
     def from_content(cls, content: str) -> "ExecutionPlan":
         """从AI响应内容创建执行计划"""
         try:
-            data = json.loads(content)
+            data = json_loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+        except TypeError as e:
+            raise ValueError(f"Invalid data format: {str(e)}")
+        return cls.from_dict(data)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExecutionPlan":
+        """从已解析的AI响应数据创建执行计划"""
+        try:
             # 验证必需字段
             required_fields = ["analysis", "selected_functions", "execution_order", "overall_confidence"]
             missing_fields = [field for field in required_fields if field not in data]
@@ -69,8 +80,6 @@ class ExecutionPlan:
                 overall_confidence=float(data["overall_confidence"])
             )
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {str(e)}")
         except (KeyError, TypeError) as e:
             raise ValueError(f"Invalid data format: {str(e)}")
 
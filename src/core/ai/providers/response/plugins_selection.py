@@ -2,6 +2,8 @@ import json
 from dataclasses import dataclass, asdict
 from typing import List
 
+from src.core.utils.json_utils import json_loads
+
 
 @dataclass
 class PluginSelectionMata:
@@ -25,7 +27,17 @@ class PluginsSelection:
     def from_content(cls, content: str) -> "PluginsSelection":
         """Create PluginSelection from AI response content"""
         try:
-            data = json.loads(content)
+            data = json_loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+        except TypeError as e:
+            raise ValueError(f"Invalid data format: {str(e)}")
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PluginsSelection":
+        """Create PluginSelection from already parsed AI response data"""
+        try:
             # Validate required fields
             required_fields = ["analysis", "selected_plugins", "overall_confidence"]
             missing_fields = [field for field in required_fields if field not in data]
@@ -49,7 +61,5 @@ class PluginsSelection:
                 overall_confidence=float(data["overall_confidence"])
             )
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {str(e)}")
         except (KeyError, TypeError) as e:
             raise ValueError(f"Invalid data format: {str(e)}")
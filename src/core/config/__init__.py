@@ -10,17 +10,45 @@ Updated: 2025-08-19 11:59:09
 User: Gordon
 """
 
+from __future__ import annotations
+
+import importlib
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .config import ConfigManager
-from .database import DataBaseManager
-from .models import (
-    AppConfig,
-    LoggingConfig,
-    DatabaseConfig,
-    PluginConfig
-)
+
+if TYPE_CHECKING:
+    from .database import DataBaseManager
+    from .models import (
+        AppConfig,
+        LoggingConfig,
+        DatabaseConfig,
+        PluginConfig
+    )
+
+# The database manager and config models are imported on first access (PEP 562),
+# so modules that only need get_logger do not load SQLAlchemy and every config model.
+_LAZY_ATTRIBUTES = {
+    "DataBaseManager": ".database",
+    "AppConfig": ".models",
+    "LoggingConfig": ".models",
+    "DatabaseConfig": ".models",
+    "PluginConfig": ".models",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 # Global cache variables for singleton behavior
 _config_manager_instance: Optional[ConfigManager] = None
@@ -54,6 +82,7 @@ def create_database_manager(db_url: Optional[str] = None) -> DataBaseManager:
     Returns:
         DataBaseManager: An instance of DataBaseManager.
     """
+    from .database import DataBaseManager
     return DataBaseManager(db_url)
 
 
@@ -71,6 +100,7 @@ def get_app_config() -> AppConfig:
     """
     global _app_config_instance
     if _app_config_instance is None:
+        from .models import AppConfig
         cfg = create_config_manager()
         _app_config_instance = cfg.load_config_model(AppConfig, "app")
     return _app_config_instance
@@ -85,6 +115,7 @@ def get_database_config() -> DatabaseConfig:
     """
     global _database_config_instance
     if _database_config_instance is None:
+        from .models import DatabaseConfig
         cfg = create_config_manager()
         _database_config_instance = cfg.load_config_model(DatabaseConfig, "database")
     return _database_config_instance
@@ -99,6 +130,7 @@ def get_plugin_config() -> PluginConfig:
     """
     global _plugin_config_instance
     if _plugin_config_instance is None:
+        from .models import PluginConfig
         cfg = create_config_manager()
         _plugin_config_instance = cfg.load_config_model(PluginConfig, "plugin")
     return _plugin_config_instance
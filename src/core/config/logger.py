@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.core.config.config import ConfigManager
-from src.core.config.logger_handler import ColoredFormatter
+from src.core.config.logger_handler import CachedTimeFormatter, ColoredFormatter
 from src.core.config.models import LoggingConfig
 
 # 全局配置
@@ -60,7 +60,7 @@ def setup_logging():
         handlers.append(file_handler)
 
         # File handler uses normal formatter (no colors)
-        file_formatter = logging.Formatter(
+        file_formatter = CachedTimeFormatter(
             fmt="%(asctime)s - Nuwa - %(name)s - %(levelname)s - %(message)s (%(filename)s:%(lineno)d)",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
@@ -147,4 +147,4 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 
 __all__ = [
     "get_logger"
-]
\ No newline at end of file
+]
@@ -1,8 +1,31 @@
 import logging
 import sys
+import time
 
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-class ColoredFormatter(logging.Formatter):
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats asctime at most once per second"""
+
+    default_msec_format = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted) pair, swapped atomically so concurrent handlers never see a torn cache
+        self._time_cache = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        cached_sec, cached_str = self._time_cache
+        if sec == cached_sec:
+            return cached_str
+        formatted = time.strftime(datefmt or self.datefmt or DEFAULT_DATE_FORMAT, self.converter(sec))
+        self._time_cache = (sec, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Simple colored formatter"""
 
     COLORS = {
@@ -25,6 +48,6 @@ class ColoredFormatter(logging.Formatter):
 
 
 __all__ = [
+    "CachedTimeFormatter",
     "ColoredFormatter"
 ]
-
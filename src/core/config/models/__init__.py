@@ -1,12 +1,38 @@
-from src.core.config.models.ai_model import AIModel, AIProviderEnum, AIConfig
-from src.core.config.models.db_models import DbBase, DatabaseConfig
-from src.core.config.models.logger_models import LoggingConfig
-from src.core.config.models.app_models import AppConfig
-from pydantic import BaseModel, Field
-
-
-class PluginConfig(BaseModel):
-    auto_discovery: bool = Field(True, description="是否自动发现插件")
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.config.models.ai_model import AIModel, AIProviderEnum, AIConfig
+    from src.core.config.models.db_models import DbBase, DatabaseConfig
+    from src.core.config.models.logger_models import LoggingConfig
+    from src.core.config.models.app_models import AppConfig
+    from src.core.config.models.plugin_models import PluginConfig
+
+# Models are imported on first access (PEP 562) so that importing one config model
+# does not build every pydantic model and the SQLAlchemy declarative base.
+_LAZY_MODELS = {
+    "AIModel": "ai_model",
+    "AIProviderEnum": "ai_model",
+    "AIConfig": "ai_model",
+    "DbBase": "db_models",
+    "DatabaseConfig": "db_models",
+    "LoggingConfig": "logger_models",
+    "AppConfig": "app_models",
+    "PluginConfig": "plugin_models",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODELS))
 
 
 __all__ = [
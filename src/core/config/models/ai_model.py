@@ -30,6 +30,8 @@ class AIConfig:
     max_tokens: int = 1024
     request_timeout: int = 60
     anthropic_version: str = None
+    # 以流式(SSE)方式接收响应，仅对支持流式的提供者生效
+    stream: bool = False
 
     @classmethod
     def from_dict(cls, data: dict) -> "AIConfig":
@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class PluginConfig(BaseModel):
+    auto_discovery: bool = Field(True, description="是否自动发现插件")
@@ -3,6 +3,7 @@ from typing import Optional
 from src.core.ai import AIManager
 from src.core.config import create_database_manager, DataBaseManager
 from src.core.di.container import container
+from src.core.mcp import MCPServer
 from src.core.orchestration import IntelligentRouter, TaskPlanner
 from src.core.plugin import PluginManager
 from src.core.scheduler import SchedulerRegister
@@ -62,6 +63,9 @@ class ServiceBootstrap:
         )
         container.register_singleton(IntelligentRouter, router)
 
+        # MCP JSON-RPC 服务
+        container.register_singleton(MCPServer, MCPServer(plugin_manager=self._plugin_manager))
+
         # 任务服务 - 使用工厂注册，支持依赖注入
         container.register_factory(StepHandler, lambda: StepHandler(
             db=container.get(DataBaseManager)
@@ -1,90 +1,220 @@
 import inspect
-from typing import Dict, Type, Any, TypeVar
+import threading
+from contextvars import ContextVar
+from typing import Dict, Type, Any, TypeVar, List, Tuple, Callable, Optional, Set
 
 T = TypeVar('T')
 
+_EMPTY = inspect.Parameter.empty
+_VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+# 当前正在编译的类型链，用于检测循环依赖
+_resolving: ContextVar[Optional[Set[Type]]] = ContextVar("di_resolving", default=None)
+
 
 class DIContainer:
     """依赖注入容器"""
 
+    __slots__ = (
+        '_services', '_factories', '_singletons', '_transients', '_type_mappings', '_sig_cache',
+        '_compiled', '_singletons_by_type', '_factories_by_type', '_can_auto', '_write_lock'
+    )
+
     def __init__(self):
         self._services: Dict[str, Any] = {}
         self._factories: Dict[str, callable] = {}
         self._singletons: Dict[str, Any] = {}
+        self._transients: Dict[str, Type] = {}
         self._type_mappings: Dict[Type, str] = {}
+        # 构造函数参数缓存: cls -> [(参数名, 类型注解, 默认值)]
+        self._sig_cache: Dict[Type, List[Tuple[str, Any, Any]]] = {}
+        # 预编译的解析器: key -> 无参可调用对象，命中后 get() 只需一次字典查找
+        self._compiled: Dict[str, Callable[[], Any]] = {}
+        # 按类型对象索引的单例/工厂，命中时跳过键名拼接
+        self._singletons_by_type: Dict[Type, Any] = {}
+        self._factories_by_type: Dict[Type, Callable[[], Any]] = {}
+        # 类型能否自动创建（所有注解依赖均可解析）的缓存
+        self._can_auto: Dict[Type, bool] = {}
+        # 只保护注册与编译；get() 的命中路径无锁
+        self._write_lock = threading.RLock()
 
     def register_singleton(self, interface: Type[T], implementation: T) -> None:
         """注册单例服务"""
-        key = self._get_key(interface)
-        self._singletons[key] = implementation
-        self._type_mappings[interface] = key
+        with self._write_lock:
+            key = self._get_key(interface)
+            self._singletons[key] = implementation
+            self._singletons_by_type[interface] = implementation
+            self._compiled.clear()
+            self._can_auto.clear()
+            self._type_mappings[interface] = key
 
     def register_factory(self, interface: Type[T], factory: callable) -> None:
         """注册工厂方法"""
-        key = self._get_key(interface)
-        self._factories[key] = factory
-        self._type_mappings[interface] = key
+        with self._write_lock:
+            key = self._get_key(interface)
+            self._factories[key] = factory
+            self._factories_by_type[interface] = factory
+            self._transients.pop(key, None)
+            self._compiled.clear()
+            self._can_auto.clear()
+            self._type_mappings[interface] = key
 
     def register_transient(self, interface: Type[T], implementation_class: Type[T]) -> None:
         """注册瞬时服务（每次获取都创建新实例）"""
-        key = self._get_key(interface)
-        self._factories[key] = lambda: self._create_instance(implementation_class)
-        self._type_mappings[interface] = key
+        with self._write_lock:
+            key = self._get_key(interface)
+            # 构造函数在首次解析时编译为闭包，之后每次获取都是一次直接构造调用
+            self._transients[key] = implementation_class
+            self._factories.pop(key, None)
+            self._factories_by_type.pop(interface, None)
+            self._compiled.clear()
+            self._can_auto.clear()
+            self._type_mappings[interface] = key
 
     def get(self, interface: Type[T]) -> T:
         """获取服务实例"""
+        instance = self._singletons_by_type.get(interface)
+        if instance is not None:
+            return instance
+
+        factory = self._factories_by_type.get(interface)
+        if factory is not None:
+            return factory()
+
         key = self._get_key(interface)
 
-        # 优先返回单例
-        if key in self._singletons:
-            return self._singletons[key]
+        resolver = self._compiled.get(key)
+        if resolver is not None:
+            return resolver()
 
-        # 使用工厂创建
-        if key in self._factories:
-            return self._factories[key]()
+        # 优先返回单例 / 使用工厂创建
+        if key in self._singletons or key in self._factories or key in self._transients:
+            return self._resolver_for(interface)()
 
         # 尝试自动创建（如果没有注册但类可以实例化）
-        if inspect.isclass(interface):
-            try:
-                return self._create_instance(interface)
-            except Exception:
-                pass
+        if self._can_auto_create(interface):
+            return self._resolver_for(interface)()
 
         raise ValueError(f"Service {interface.__name__} not registered")
 
-    def _get_key(self, interface: Type) -> str:
-        """获取服务的键名"""
-        return f"{interface.__module__}.{interface.__name__}"
-
-    def _create_instance(self, cls: Type[T]) -> T:
-        """自动创建实例（支持构造函数注入）"""
-        # 获取构造函数参数
-        sig = inspect.signature(cls.__init__)
-        params = {}
+    def _can_auto_create(self, interface: Type) -> bool:
+        """判断未注册的类型能否通过构造函数注入自动创建（结果缓存）"""
+        can_auto = self._can_auto.get(interface)
+        if can_auto is None:
+            with self._write_lock:
+                can_auto = inspect.isclass(interface)
+                if can_auto:
+                    try:
+                        self._resolver_for(interface)
+                    except ValueError:
+                        can_auto = False
+                self._can_auto[interface] = can_auto
+        return can_auto
 
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-
-            # 如果参数有类型注解，尝试从容器中获取
-            if param.annotation != inspect.Parameter.empty:
+    def _get_key(self, interface: Type) -> str:
+        """获取服务的键名（按类型缓存）"""
+        key = self._type_mappings.get(interface)
+        if key is None:
+            module = getattr(interface, '__module__', None)
+            name = getattr(interface, '__name__', None)
+            if module is None or name is None:
+                # 字符串 / 前向引用等非类型注解无法解析，按未注册处理，调用方可回退到默认值
+                raise ValueError(f"Cannot resolve non-type annotation {interface!r}")
+            key = self._type_mappings.setdefault(interface, f"{module}.{name}")
+        return key
+
+    def _get_init_params(self, cls: Type) -> List[Tuple[str, Any, Any]]:
+        """获取构造函数参数（按类缓存，避免重复反射）"""
+        params = self._sig_cache.get(cls)
+        if params is None:
+            params = [
+                (name, param.annotation, param.default)
+                for name, param in inspect.signature(cls.__init__).parameters.items()
+                if name != 'self' and param.kind not in _VAR_KINDS
+            ]
+            self._sig_cache[cls] = params
+        return params
+
+    def _resolver_for(self, interface: Type) -> Callable[[], Any]:
+        """获取（必要时编译）服务的解析器，不创建实例"""
+        key = self._get_key(interface)
+        resolver = self._compiled.get(key)
+        if resolver is not None:
+            return resolver
+
+        with self._write_lock:
+            # 双重检查：其他线程可能已完成编译
+            resolver = self._compiled.get(key)
+            if resolver is not None:
+                return resolver
+
+            if key in self._singletons:
+                instance = self._singletons[key]
+                resolver = lambda: instance
+            elif key in self._factories:
+                resolver = self._factories[key]
+            elif key in self._transients:
+                resolver = self._compile_constructor(self._transients[key])
+            elif inspect.isclass(interface):
+                resolver = self._compile_constructor(interface)
+            else:
+                raise ValueError(f"Service {interface.__name__} not registered")
+
+            self._compiled[key] = resolver
+            return resolver
+
+    def _compile_constructor(self, cls: Type[T]) -> Callable[[], T]:
+        """将构造函数注入编译为闭包，依赖的解析器只查找一次"""
+        resolving = _resolving.get()
+        if resolving is None:
+            resolving = set()
+            _resolving.set(resolving)
+        if cls in resolving:
+            raise ValueError(f"Cyclic dependency detected while resolving {cls.__name__}")
+
+        resolving.add(cls)
+        try:
+            resolvers = []
+
+            for param_name, annotation, default in self._get_init_params(cls):
+                # 没有类型注解也没有默认值的参数无法注入
+                if annotation is _EMPTY:
+                    if default is _EMPTY:
+                        raise ValueError(f"Cannot resolve parameter '{param_name}' for {cls.__name__}")
+                    continue
+
+                # 如果参数有类型注解，尝试从容器中获取
                 try:
-                    params[param_name] = self.get(param.annotation)
+                    resolvers.append((param_name, self._resolver_for(annotation)))
                 except ValueError:
                     # 如果有默认值，使用默认值
-                    if param.default != inspect.Parameter.empty:
-                        params[param_name] = param.default
+                    if default is not _EMPTY:
+                        resolvers.append((param_name, lambda value=default: value))
                     else:
-                        raise ValueError(f"Cannot resolve dependency {param.annotation} for {cls.__name__}")
+                        raise ValueError(f"Cannot resolve dependency {annotation} for {cls.__name__}")
+        finally:
+            resolving.discard(cls)
+
+        resolvers = tuple(resolvers)
+
+        def resolve() -> T:
+            return cls(**{name: dependency() for name, dependency in resolvers})
 
-        return cls(**params)
+        return resolve
 
     def clear(self) -> None:
         """清空容器"""
-        self._services.clear()
-        self._factories.clear()
-        self._singletons.clear()
-        self._type_mappings.clear()
+        with self._write_lock:
+            self._services.clear()
+            self._factories.clear()
+            self._singletons.clear()
+            self._transients.clear()
+            self._type_mappings.clear()
+            self._sig_cache.clear()
+            self._compiled.clear()
+            self._singletons_by_type.clear()
+            self._factories_by_type.clear()
+            self._can_auto.clear()
 
 
 # 全局容器实例
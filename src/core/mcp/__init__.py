@@ -1,5 +1,4 @@
 # MCP Protocol Package
 from .server import MCPServer
-from .client import MCPClient
 
-__all__ = ["MCPServer", "MCPClient"]
+__all__ = ["MCPServer"]
@@ -8,17 +8,21 @@
 # ]
 from enum import Enum
 
-from .request import MCPRequestSchema
-from .response import MCPResponseSchema
-
 
 class JSONRPCVersion(str, Enum):
     """JSON-RPC版本"""
     V2_0 = "2.0"
 
 
+# request/response 模块会从本包导入 JSONRPCVersion，需在其定义之后导入
+from .request import MCPRequestSchema, get_mcp_request_schema
+from .response import MCPResponseSchema, get_mcp_response_schema
+
+
 __all__ = [
     "JSONRPCVersion",
     "MCPRequestSchema",
-    "MCPResponseSchema"
+    "MCPResponseSchema",
+    "get_mcp_request_schema",
+    "get_mcp_response_schema"
 ]
@@ -4,9 +4,10 @@
 #     method: str = "camera.take_photo"
 #     params: Dict[str, Any]
 
+from functools import lru_cache
 from typing import Dict, Any, Union, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.mcp.rpc import JSONRPCVersion
 
@@ -14,32 +15,32 @@ from src.core.mcp.rpc import JSONRPCVersion
 class McpRequestParams(BaseModel):
     """MCP request parameters containing function name and arguments"""
 
-    fun_name: str = Field(..., description="Plugin ID to invoke")
-    arguments: Dict[str, Any] = Field(default_factory=dict, description="Method arguments")
-
-    class Config:
-        schema_extra = {
-            "example": {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
+            "examples": [{
                 "fun_name": "camera_capture",
                 "arguments": {
                     "device_id": 0,
                     "format": "jpg"
                 }
-            }
+            }]
         }
+    )
+
+    fun_name: str = Field(..., description="Plugin ID to invoke")
+    arguments: Dict[str, Any] = Field(default_factory=dict, description="Method arguments")
 
 
 class MCPRequestSchema(BaseModel):
     """MCP request schema following JSON-RPC 2.0 specification"""
 
-    jsonrpc: JSONRPCVersion = Field(default=JSONRPCVersion.V2_0, description="JSON-RPC version")
-    method: str = Field(..., description="Method name to call")
-    params: Optional[McpRequestParams] = Field(None, description="Method parameters")
-    id: Optional[Union[str, int]] = Field(None, description="Request ID for response correlation")
-
-    class Config:
-        schema_extra = {
-            "example": {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
+            "examples": [{
                 "jsonrpc": "2.0",
                 "method": "execute_plugin",
                 "params": {
@@ -50,5 +51,17 @@ class MCPRequestSchema(BaseModel):
                     }
                 },
                 "id": "req_001"
-            }
+            }]
         }
+    )
+
+    jsonrpc: JSONRPCVersion = Field(default=JSONRPCVersion.V2_0, description="JSON-RPC version")
+    method: str = Field(..., description="Method name to call")
+    params: Optional[McpRequestParams] = Field(None, description="Method parameters")
+    id: Optional[Union[str, int]] = Field(None, description="Request ID for response correlation")
+
+
+@lru_cache(maxsize=None)
+def get_mcp_request_schema() -> Dict[str, Any]:
+    """MCPRequestSchema 的 JSON Schema，只生成一次；返回共享对象，调用方不应修改"""
+    return MCPRequestSchema.model_json_schema()
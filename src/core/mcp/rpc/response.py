@@ -1,35 +1,39 @@
+from functools import lru_cache
 from typing import Dict, Any, Union, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic import Field
 
 from src.core.mcp.rpc import JSONRPCVersion
 
 
 class JSONRPCError(BaseModel):
+    # 标准错误以模块级单例复用，必须不可变
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     code: int
     message: str
     data: Any = None
 
     @staticmethod
     def parse_error(msg: str = "Parse error") -> "JSONRPCError":
-        return JSONRPCError(code=-32700, message=msg)
+        return _PARSE_ERROR if msg == "Parse error" else JSONRPCError(code=-32700, message=msg)
 
     @staticmethod
     def invalid_request(msg: str = "Invalid Request") -> "JSONRPCError":
-        return JSONRPCError(code=-32600, message=msg)
+        return _INVALID_REQUEST if msg == "Invalid Request" else JSONRPCError(code=-32600, message=msg)
 
     @staticmethod
     def method_not_found(msg: str = "Method not found") -> "JSONRPCError":
-        return JSONRPCError(code=-32601, message=msg)
+        return _METHOD_NOT_FOUND if msg == "Method not found" else JSONRPCError(code=-32601, message=msg)
 
     @staticmethod
     def invalid_params(msg: str = "Invalid params") -> "JSONRPCError":
-        return JSONRPCError(code=-32602, message=msg)
+        return _INVALID_PARAMS if msg == "Invalid params" else JSONRPCError(code=-32602, message=msg)
 
     @staticmethod
     def internal_error(msg: str = "Internal error") -> "JSONRPCError":
-        return JSONRPCError(code=-32603, message=msg)
+        return _INTERNAL_ERROR if msg == "Internal error" else JSONRPCError(code=-32603, message=msg)
 
     @staticmethod
     def custom(code: int, msg: str, data: Any = None) -> "JSONRPCError":
@@ -43,6 +47,14 @@ class JSONRPCError(BaseModel):
         }
 
 
+# 标准错误（默认消息）只创建一次
+_PARSE_ERROR = JSONRPCError(code=-32700, message="Parse error")
+_INVALID_REQUEST = JSONRPCError(code=-32600, message="Invalid Request")
+_METHOD_NOT_FOUND = JSONRPCError(code=-32601, message="Method not found")
+_INVALID_PARAMS = JSONRPCError(code=-32602, message="Invalid params")
+_INTERNAL_ERROR = JSONRPCError(code=-32603, message="Internal error")
+
+
 #
 # class JSONRPCResponse(BaseModel):
 #     jsonrpc: str = "2.0"
@@ -52,6 +64,8 @@ class JSONRPCError(BaseModel):
 
 class MCPResponseSchema(BaseModel):
     """MCP 响应 Schema"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     jsonrpc: JSONRPCVersion = JSONRPCVersion.V2_0
     result: Optional[Any] = Field(None, description="方法执行结果")
     error: Optional[Dict[str, Any]] = Field(None, description="错误信息")
@@ -65,3 +79,19 @@ class MCPResponseSchema(BaseModel):
     @staticmethod
     def fail(request_id: Union[str, int], error: JSONRPCError):
         return MCPResponseSchema(error=error.to_dict(), id=request_id)
+
+    @staticmethod
+    def success_payload(result: Any, rid: Optional[Union[str, int]] = None) -> Dict[str, Any]:
+        """成功响应的线上格式，直接序列化，不构建模型"""
+        return {"jsonrpc": "2.0", "result": result, "id": rid}
+
+    @staticmethod
+    def fail_payload(request_id: Optional[Union[str, int]], error: JSONRPCError) -> Dict[str, Any]:
+        """失败响应的线上格式，直接序列化，不构建模型"""
+        return {"jsonrpc": "2.0", "error": error.to_dict(), "id": request_id}
+
+
+@lru_cache(maxsize=None)
+def get_mcp_response_schema() -> Dict[str, Any]:
+    """MCPResponseSchema 的 JSON Schema，只生成一次；返回共享对象，调用方不应修改"""
+    return MCPResponseSchema.model_json_schema()
@@ -1,32 +1,133 @@
 # MCP Server Module
 import asyncio
+import inspect
 import logging
-# PluginRegistration
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
 
 from src.core.mcp.rpc import MCPRequestSchema, MCPResponseSchema
 from src.core.mcp.rpc.response import JSONRPCError
 from src.core.plugin import PluginManager
+from src.core.plugin.model import PluginRegistration, PluginInfoProviderDefinition
+from src.core.utils import json_dumps, json_loads
 
 LOGGER = logging.getLogger(__name__)
 
+# 分发表条目: 提供该函数的服务
+_DispatchEntry = PluginInfoProviderDefinition
+
 
 class MCPServer:
     def __init__(self, plugin_manager: PluginManager) -> None:
         self.plugin_manager = plugin_manager
+        # (插件ID, 函数名) -> 分发表条目；插件首次被调用时整体构建
+        self._dispatch_table: Dict[Tuple[str, str], _DispatchEntry] = {}
+        # 插件ID -> 构建分发表时的注册对象；插件重新注册后对象变化即重建
+        self._dispatch_plugins: Dict[str, PluginRegistration] = {}
+
+    async def handle(self, body: Union[bytes, str]) -> Optional[bytes]:
+        """处理原始请求体并返回序列化后的响应体
+
+        请求由 pydantic-core 一次完成 JSON 解析与校验，不经过中间 dict；
+        响应直接以 dict 经 orjson 序列化，不构建 MCPResponseSchema。
+        请求体为数组时按 JSON-RPC 批量请求处理。
+        通知（id 为空）照常执行但不产生响应；没有任何响应需要返回时返回 None，传输层不应写响应体。
+        """
+        if body.lstrip()[:1] in (b"[", "["):
+            try:
+                payload = json_loads(body)
+            except ValueError:
+                return json_dumps(MCPResponseSchema.fail_payload(None, JSONRPCError.parse_error()))
+            if not payload:
+                return json_dumps(MCPResponseSchema.fail_payload(None, JSONRPCError.invalid_request()))
+            responses = await self.call_batch(payload)
+            return b"[" + b",".join(map(self._encode, responses)) + b"]" if responses else None
+
+        try:
+            req = MCPRequestSchema.model_validate_json(body)
+        except ValidationError as exc:
+            if any(err["type"] == "json_invalid" for err in exc.errors()):
+                return json_dumps(MCPResponseSchema.fail_payload(None, JSONRPCError.parse_error()))
+            return json_dumps(MCPResponseSchema.fail_payload(None, JSONRPCError.invalid_request(str(exc))))
+        response = await self._dispatch(req)
+        return self._encode(response) if response is not None else None
+
+    @staticmethod
+    def _encode(response: Dict[str, Any]) -> bytes:
+        """逐个序列化响应；插件结果无法编码时改为该请求的 internal_error 响应，同一批次的其他响应不受影响"""
+        try:
+            return json_dumps(response)
+        except (TypeError, ValueError) as exc:
+            LOGGER.error("❌ Response for request %r is not JSON serializable: %s", response.get("id"), exc)
+            return json_dumps(MCPResponseSchema.fail_payload(
+                response.get("id"), JSONRPCError.internal_error(f"Result is not JSON serializable: {exc}")))
+
+    async def call(self, req: MCPRequestSchema) -> Optional[MCPResponseSchema]:
+        """执行单个请求；通知（id 为空）返回 None"""
+        response = await self._dispatch(req)
+        return MCPResponseSchema(**response) if response is not None else None
 
-    async def call(self, req: MCPRequestSchema) -> MCPResponseSchema:
+    async def call_batch(self, payload: List[Any]) -> List[Dict[str, Any]]:
+        """并发执行批量请求，按请求顺序返回响应；通知（id 为空）不产生响应"""
+        responses = await asyncio.gather(*(self._dispatch_batch_item(item) for item in payload))
+        return [response for response in responses if response is not None]
+
+    async def _dispatch_batch_item(self, item: Any) -> Optional[Dict[str, Any]]:
+        try:
+            req = MCPRequestSchema.model_validate(item)
+        except ValidationError as exc:
+            return MCPResponseSchema.fail_payload(None, JSONRPCError.invalid_request(str(exc)))
+        return await self._dispatch(req)
+
+    async def _dispatch(self, req: MCPRequestSchema) -> Optional[Dict[str, Any]]:
+        """执行请求并返回线上格式的响应；通知不返回响应，包括执行失败时"""
+        response = await self._execute(req)
+        return response if req.id is not None else None
+
+    async def _execute(self, req: MCPRequestSchema) -> Dict[str, Any]:
+        """method 为插件ID，params.fun_name 为插件函数名，params.arguments 为调用参数"""
         plugin_id: str = req.method
-        params: Dict[str, Any] = req.params or {}
+        if req.params is None:
+            return MCPResponseSchema.fail_payload(req.id, JSONRPCError.invalid_params("Missing params.fun_name"))
+        fun_name = req.params.fun_name
+
+        entry = await self._get_dispatch_entry(plugin_id, fun_name)
+        if entry is None:
+            return MCPResponseSchema.fail_payload(
+                req.id, JSONRPCError.method_not_found(f"Method '{fun_name}' not found in plugin '{plugin_id}'"))
+
         try:
-            result = self.plugin_manager.call(plugin_id, req.method, **params)
-            if result:
-                return MCPResponseSchema.success(result)
-            else:
-                return MCPResponseSchema.success(None)
+            result = getattr(entry.instance(), fun_name)(**req.params.arguments)
+            # 按实际调用结果判断是否需要 await，实例上重新绑定或包装过的方法也能正确调用
+            if inspect.isawaitable(result):
+                result = await result
+            return MCPResponseSchema.success_payload(result, req.id)
         except Exception as exc:
-            # LOGGER.exception("❌ %s.%s call failed: %s", adapter_name, method_name, exc)
-            LOGGER.error("❌ %s.%s call failed: %s", plugin_id, req.method, exc)
-            LOGGER.exception(exc)
-            return MCPResponseSchema.fail(req.id, JSONRPCError.internal_error(str(exc)))
+            # 单次记录；失败突发时只在 DEBUG 级别才格式化堆栈
+            LOGGER.error("❌ %s.%s call failed: %s", plugin_id, fun_name, exc,
+                         exc_info=LOGGER.isEnabledFor(logging.DEBUG))
+            return MCPResponseSchema.fail_payload(req.id, JSONRPCError.internal_error(str(exc)))
+
+    async def _get_dispatch_entry(self, plugin_id: str, fun_name: str) -> Optional[_DispatchEntry]:
+        plugin = await self.plugin_manager.get_plugin_by_id(plugin_id)
+        if plugin is None:
+            return None
+
+        if self._dispatch_plugins.get(plugin_id) is not plugin:
+            self._build_dispatch_entries(plugin)
+        return self._dispatch_table.get((plugin_id, fun_name))
+
+    def _build_dispatch_entries(self, plugin: PluginRegistration) -> None:
+        """为插件的全部函数建立分发表条目，同名函数以先出现的服务为准"""
+        for key in [k for k in self._dispatch_table if k[0] == plugin.id]:
+            del self._dispatch_table[key]
 
+        for service in plugin.plugin_services:
+            for fun in service.resolve_functions():
+                name = fun.get('name') if isinstance(fun, dict) else getattr(fun, 'name', None)
+                if not name or (plugin.id, name) in self._dispatch_table:
+                    continue
+                self._dispatch_table[(plugin.id, sys.intern(name))] = service
+        self._dispatch_plugins[plugin.id] = plugin
@@ -1,6 +1,30 @@
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.orchestration.task_planner import TaskPlanner
+    from src.core.orchestration.intelligent_router import IntelligentRouter
+
+# Imported on first access (PEP 562) so that importing orchestration.model does not
+# pull in AIManager, the plugin manager and the prompt templates.
+_LAZY_MODULES = {
+    "TaskPlanner": "task_planner",
+    "IntelligentRouter": "intelligent_router",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
 
-from .task_planner import TaskPlanner
-from .intelligent_router import IntelligentRouter
 
 __all__ = [
     "TaskPlanner",
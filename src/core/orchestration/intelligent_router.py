@@ -1,5 +1,7 @@
-import json
-from typing import Any, Dict, Optional, List
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, List, Tuple
 
 from src.core.ai import AIManager
 from src.core.ai.providers.response import ExecutionPlan
@@ -13,6 +15,11 @@ LOGGER = get_logger(__name__)
 
 
 class IntelligentRouter:
+    # 可用插件列表的缓存时间（秒），插件列表只会在人工操作时变化
+    PLUGINS_CACHE_TTL = 5.0
+    # 可用插件的函数总数不超过该值时，插件筛选和执行计划合并为一次AI调用
+    UNIFIED_PLAN_MAX_FUNCTIONS = 30
+
     def __init__(
             self,
             # plugin_service: PluginInfoProvider,
@@ -26,15 +33,25 @@ class IntelligentRouter:
         self.plugin_manager = plugin_manager
         self.TaskPlanner = TaskPlanner
         self.model = model
+        # 可用插件缓存: (写入时间, 插件基础信息列表, 按ID索引的插件注册对象)，两者都只在刷新时构建一次
+        self._plugins_cache: Optional[Tuple[float, List[Dict[str, Any]], Dict[str, PluginRegistration]]] = None
+        # 缓存失效时只允许一个协程刷新，并发请求等待并共享同一次结果
+        self._plugins_lock = asyncio.Lock()
+        plugin_manager.add_change_listener(self.invalidate_plugins_cache)
 
     async def analyze_and_plan(self, user_input: str) -> PlanResult:
         try:
-            LOGGER.info(f"🤖 开始分析用户需求: {user_input}")
+            LOGGER.info("🤖 开始分析用户需求: %s", user_input)
             if not user_input or not user_input.strip():
                 return PlanResult.error_result("用户输入不能为空")
-            available_plugins = await self.list_available_plugins()
+            # 整个请求使用同一份插件快照，后续按ID查找无需再访问插件管理器
+            _, available_plugins, registrations = await self._get_plugins_cache()
             if not available_plugins or len(available_plugins) == 0:
                 return PlanResult.error_result("没有可用的插件", suggestion="请检查插件是否正确加载和启用")
+            LOGGER.debug("📋 发现 %d 个可用插件", len(available_plugins))
+            plan_result = await self._plan_in_one_round_trip(user_input, available_plugins, registrations)
+            if plan_result is not None:
+                return plan_result
             selected_plugins = await self.TaskPlanner.select_plugins(user_input, available_plugins)
             if not selected_plugins:
                 return PlanResult.error_result(
@@ -43,7 +60,11 @@ class IntelligentRouter:
                     selected_plugins=[],
                     suggestion="请检查插件配置"
                 )
-            plugin_functions = await self.get_plugin_functions(selected_plugins)
+            # 仅在开启 DEBUG 时构建插件ID列表
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("🔍 已选择插件: %s", [sp.plugin_id for sp in selected_plugins])
+            plugin_functions = self._collect_plugin_functions(
+                [(sp.plugin_id, sp.reason) for sp in selected_plugins], registrations)
             if not plugin_functions:
                 return PlanResult.error_result(
                     "未找到合适的函数",
@@ -65,55 +86,105 @@ class IntelligentRouter:
                 execution_plan=execution_plan
             )
         except Exception as e:
-            LOGGER.exception(f"❌ 分析失败: {e}")
+            LOGGER.exception("❌ 分析失败: %s", e)
             return PlanResult.error_result(f"{str(e)}")
 
-    async def list_available_plugins(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'plugin_name': p.name,
-                'plugin_id': p.id,
-                'description': p.description,
-                'tags': p.tags
-            }
-            for p in await self.plugin_manager.list_available_plugins()
+    async def _plan_in_one_round_trip(self, user_input: str,
+                                      available_plugins: List[Dict[str, Any]],
+                                      registrations: Dict[str, PluginRegistration]) -> Optional[PlanResult]:
+        """插件目录较小时，用一次AI调用完成筛选和计划；返回 None 表示需要走两阶段流程"""
+        catalog = self._collect_plugin_functions([(p['plugin_id'], None) for p in available_plugins], registrations)
+        if not catalog or sum(len(p['functions']) for p in catalog) > self.UNIFIED_PLAN_MAX_FUNCTIONS:
+            return None
+        try:
+            planned = await self.TaskPlanner.select_and_plan(user_input, catalog)
+        except ValueError as e:
+            LOGGER.warning("⚠️ 合并规划结果无效，改用两阶段规划: %s", e)
+            return None
+        if planned is None:
+            return None
+
+        selected_plugins, execution_plan = planned
+        if not selected_plugins:
+            return PlanResult.error_result(
+                "未找到合适的插件",
+                user_input=user_input,
+                selected_plugins=[],
+                suggestion="请检查插件配置"
+            )
+        if not execution_plan:
+            return None
+
+        catalog_by_id = {p['plugin_id']: p for p in catalog}
+        plugin_functions = [
+            {**catalog_by_id[sp.plugin_id], 'selection_reason': sp.reason}
+            for sp in selected_plugins if sp.plugin_id in catalog_by_id
         ]
+        LOGGER.info("✅ 执行计划生成成功")
+        return PlanResult.success_result(
+            user_input=user_input,
+            selected_plugins=selected_plugins,
+            plugin_functions=plugin_functions,
+            execution_plan=execution_plan
+        )
+
+    async def list_available_plugins(self) -> List[Dict[str, Any]]:
+        """可用插件的基础信息（插件名、ID、描述、标签）；返回的是共享缓存，调用方不应修改"""
+        return (await self._get_plugins_cache())[1]
+
+    async def _get_plugins_cache(self) -> Tuple[float, List[Dict[str, Any]], Dict[str, PluginRegistration]]:
+        cache = self._plugins_cache
+        if cache is not None and time.monotonic() - cache[0] < self.PLUGINS_CACHE_TTL:
+            return cache
+        async with self._plugins_lock:
+            # 双重检查：等待锁期间其他协程可能已完成刷新
+            cache = self._plugins_cache
+            if cache is not None and time.monotonic() - cache[0] < self.PLUGINS_CACHE_TTL:
+                return cache
+            registrations = await self.plugin_manager.snapshot()
+            plugins = [
+                {
+                    'plugin_name': p.name,
+                    'plugin_id': p.id,
+                    'description': p.description,
+                    'tags': p.tags
+                }
+                for p in registrations.values()
+            ]
+            self._plugins_cache = cache = (time.monotonic(), plugins, registrations)
+            return cache
+
+    def invalidate_plugins_cache(self) -> None:
+        """插件安装/卸载/重载后调用，强制下次重新获取可用插件"""
+        self._plugins_cache = None
 
     async def get_plugin_functions(self, selected_plugins):
+        _, _, registrations = await self._get_plugins_cache()
+        return self._collect_plugin_functions([(sp.plugin_id, sp.reason) for sp in selected_plugins], registrations)
+
+    @staticmethod
+    def _collect_plugin_functions(plugins: List[Tuple[str, Optional[str]]],
+                                  registrations: Dict[str, PluginRegistration]) -> List[Dict[str, Any]]:
+        # 插件快照按ID索引，函数描述在加载时已编译，循环内没有任何 await
         plugin_functions = []
-        for selected_plugin in selected_plugins:
-            plugin_id = selected_plugin.plugin_id
-            plugin_obj: PluginRegistration = await self.plugin_manager.get_plugin_by_id(plugin_id)
-            functions = await self.extract_plugin_functions(plugin_obj)
-            if functions:
-                plugin_functions.append({
-                    'plugin_name': plugin_obj.name,
-                    'plugin_id': plugin_obj.id,
-                    'description': plugin_obj.description,
-                    'functions': functions,
-                    'selection_reason': selected_plugin.reason
-                })
+        for plugin_id, reason in plugins:
+            plugin_obj = registrations.get(plugin_id)
+            if plugin_obj is None:
+                # AI 可能返回不在可用列表中的插件ID
+                LOGGER.warning("⚠️ 插件 %s 不可用，已跳过", plugin_id)
+                continue
+            functions = plugin_obj.compile_functions()
+            if not functions:
+                continue
+            plugin_functions.append({
+                'plugin_name': plugin_obj.name,
+                'plugin_id': plugin_obj.id,
+                'description': plugin_obj.description,
+                'functions': list(functions),
+                'selection_reason': reason
+            })
         return plugin_functions
 
     async def extract_plugin_functions(self, plugin_obj: PluginRegistration):
-        functions = []
-        for service in plugin_obj.plugin_services:
-            service_function = service.functions
-            functions_list = []
-            if service_function and callable(service_function):
-                functions_list = service_function()
-            elif service_function and isinstance(service_function, list):
-                functions_list = service_function
-            elif service_function and isinstance(service_function, str):
-                functions_list = json.loads(service_function)
-            if not functions_list:
-                continue
-            for func in functions_list:
-                if isinstance(func, dict) and func.get("name"):
-                    functions.append({
-                        "name": func.get("name"),
-                        "description": func.get("description", ""),
-                        "input_schema": func.get("input_schema", {}),
-                        "full_method_name": f"{plugin_obj.name}.{func.get('name')}"
-                    })
-        return functions
+        # 函数描述在插件加载时已编译，这里只返回浅拷贝
+        return list(plugin_obj.compile_functions())
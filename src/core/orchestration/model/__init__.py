@@ -9,7 +9,7 @@ Contains models related to the plan service
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanResult:
     success: bool = False
     user_input: Optional[str] = None
@@ -44,18 +44,25 @@ class PlanResult:
         return [plugin.to_dict() for plugin in self.selected_plugins]
 
     def plugin_functions_to_dict(self) -> List[Dict[str, Any]]:
-        print(f"plugin_functions type: {type(self.plugin_functions)}")
-        if self.plugin_functions:
-            print(f"First item type: {type(self.plugin_functions[0])}")
-            print(f"First item content: {self.plugin_functions[0]}")
-
         return [
-            plugin.to_dict() if hasattr(plugin, 'to_dict') else plugin
+            to_dict() if (to_dict := getattr(plugin, 'to_dict', None)) is not None else plugin
             for plugin in self.plugin_functions or []
         ]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """逐字段构建字典，不走 dataclasses.asdict 的递归深拷贝"""
+        return {
+            "success": self.success,
+            "user_input": self.user_input,
+            "selected_plugins": [plugin.to_dict() for plugin in self.selected_plugins or ()],
+            "plugin_functions": self.plugin_functions_to_dict(),
+            "execution_plan": self.execution_plan.to_dict() if self.execution_plan else None,
+            "error": self.error,
+            "suggestion": self.suggestion
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class AIStatusResult:
     available_providers: List[str] = field(default_factory=list)
     provider_types: List[str] = field(default_factory=list)
@@ -68,12 +75,19 @@ class AIStatusResult:
     def error_result(error: str) -> "AIStatusResult":
         return AIStatusResult(error=error)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "available_providers": list(self.available_providers),
+            "provider_types": list(self.provider_types),
+            "health_status": self.health_status,
+            "preferred_provider": self.preferred_provider,
+            "fallback_providers": list(self.fallback_providers) if self.fallback_providers is not None else None,
+            "error": self.error
+        }
 
-from dataclasses import dataclass, field
-from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginStatusResult:
     total_plugins: int
     available_plugins: int
@@ -84,6 +98,14 @@ class PluginStatusResult:
     def error_result(error: str) -> "PluginStatusResult":
         return PluginStatusResult(total_plugins=0, available_plugins=0, plugin_names=[], error=error)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_plugins": self.total_plugins,
+            "available_plugins": self.available_plugins,
+            "plugin_names": list(self.plugin_names),
+            "error": self.error
+        }
+
 
 __all__ = [
     "PlanResult",
@@ -1,19 +1,70 @@
-from typing import List, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.core.ai import AIManager
-from src.core.ai.providers.response import PluginsSelection, ExecutionPlan
+from src.core.ai.providers.response import PluginsSelection, ExecutionPlan, PluginSelectionMata
+from src.core.utils.json_utils import json_loads
+
+
+_MISS = object()
 
 
 class TaskPlanner:
+    # 已解析的AI响应缓存：相同的提示词（即相同的用户输入和插件目录）在有效期内不再调用AI
+    RESPONSE_CACHE_TTL = 300.0
+    RESPONSE_CACHE_SIZE = 128
+
     def __init__(self, prompt_templates, ai_manager: AIManager):
         self.prompt_templates = prompt_templates
         self.ai_manager: AIManager = ai_manager
         self.primary_provider = None
         self.fallback_providers = None
         self.choose_model = None
+        # 提示词摘要 -> (写入时间, 解析后的结果)，按最近使用排序
+        self._response_cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _cache_key(kind: str, prompt) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (kind, prompt.system_prompt, prompt.user_prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _cache_get(self, key: bytes) -> Any:
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return _MISS
+        if time.monotonic() - entry[0] >= self.RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return _MISS
+        self._response_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: bytes, value: Any) -> None:
+        self._response_cache[key] = (time.monotonic(), value)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self) -> None:
+        self._response_cache.clear()
 
     async def select_plugins(self, user_input, plugins_basic_info: List[Dict[str, Any]]):
+        # 只有一个可用插件时筛选结果是确定的，无需调用AI；与需求是否相关交由执行计划阶段判断
+        if len(plugins_basic_info) <= 1:
+            return [
+                PluginSelectionMata(plugin_name=p['plugin_name'], plugin_id=p['plugin_id'],
+                                    reason="唯一可用插件", confidence=1.0)
+                for p in plugins_basic_info
+            ]
         prompt = self.prompt_templates.get_plugin_selection_prompt(plugins_basic_info, user_input)
+        key = self._cache_key("select_plugins", prompt)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
         response = await self.ai_manager.call_with_fallback(
             system_prompt=prompt.system_prompt,
             user_prompt=prompt.user_prompt
@@ -23,10 +74,16 @@ class TaskPlanner:
         data = PluginsSelection.from_content(response.data)
         if data is None:
             return []
+        if data.selected_plugins:
+            self._cache_put(key, data.selected_plugins)
         return data.selected_plugins
 
     async def plan_execution(self, user_input, plugin_functions) -> ExecutionPlan | None:
         prompt = self.prompt_templates.get_function_matching_prompt(plugin_functions, user_input)
+        key = self._cache_key("plan_execution", prompt)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
         response = await self.ai_manager.call_with_fallback(
             system_prompt=prompt.system_prompt,
             user_prompt=prompt.user_prompt,
@@ -34,4 +91,31 @@ class TaskPlanner:
         if not response or not response.success:
             return None
         execution_plan = ExecutionPlan.from_content(response.data)
+        self._cache_put(key, execution_plan)
         return execution_plan
+
+    async def select_and_plan(self, user_input, plugins_with_functions: List[Dict[str, Any]]) \
+            -> Optional[Tuple[List[PluginSelectionMata], Optional[ExecutionPlan]]]:
+        """一次AI调用同时完成插件筛选和执行计划生成，AI调用失败时返回 None"""
+        prompt = self.prompt_templates.get_selection_and_plan_prompt(plugins_with_functions, user_input)
+        key = self._cache_key("select_and_plan", prompt)
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
+        response = await self.ai_manager.call_with_fallback(
+            system_prompt=prompt.system_prompt,
+            user_prompt=prompt.user_prompt,
+        )
+        if not response or not response.success:
+            return None
+        try:
+            data = json_loads(response.data)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+        selection = PluginsSelection.from_dict(data)
+        if not selection.selected_plugins:
+            return [], None
+        execution_plan = ExecutionPlan.from_dict(data["execution_plan"]) if data.get("execution_plan") else None
+        if execution_plan is not None:
+            self._cache_put(key, (selection.selected_plugins, execution_plan))
+        return selection.selected_plugins, execution_plan
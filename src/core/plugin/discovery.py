@@ -1,17 +1,29 @@
+import asyncio
+import hashlib
 import importlib.util
 import os
 import subprocess
 import sys
+import warnings
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.core.config import get_logger
 from src.core.plugin.model.plugins import PluginDiscoveryResult
 from src.core.utils.common_utils import project_root
-from src.core.utils.plugin_loader import PluginEnvironment, PluginModuleRewriter
+from src.core.utils.json_utils import json_dumps, json_loads
+from src.core.utils.plugin_loader import PluginEnvironment, PluginModuleFinder
 
 logger = get_logger(__name__)
 
+_MISSING = object()
+
+# 不是插件、也不参与目录指纹的目录；以 . 开头的目录同样跳过
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', 'venv', '.venv'})
+
+# 依赖指纹缓存文件，保存在插件根目录下
+DEPENDENCY_CACHE_FILE = ".nuwa_dep_cache.json"
+
 
 class PluginDiscovery:
     """Improved plugin discovery system with fully isolated plugin environments"""
@@ -20,6 +32,12 @@ class PluginDiscovery:
         self.plugins_root = Path(plugins_root)
         self.plugins: List[PluginDiscoveryResult] = []
         self.stopped = False
+        # 插件目录 -> (目录指纹, 加载结果)；再次发现时目录未变化则直接复用
+        self._loaded: Dict[Path, Tuple[int, PluginDiscoveryResult]] = {}
+        # 插件目录名 -> 上次安装成功时的依赖指纹，持久化在插件根目录下
+        self._dependency_cache: Optional[Dict[str, str]] = None
+        # 插件目录 -> 最近一次加载注册的模块查找器
+        self._finders: Dict[Path, PluginModuleFinder] = {}
 
     async def stop(self):
         self.stopped = True
@@ -32,145 +50,318 @@ class PluginDiscovery:
         if not self.stopped:
             self.stopped = False
 
-        for plugin_dir in self.plugins_root.iterdir():
-            if plugin_dir.is_dir() and not self.stopped:
-                self._load_plugin_with_isolation(plugin_dir)
-
-    def _load_plugin_initializer(self, plugin_dir: Path):
-        init_path = plugin_dir / "__init__.py"
-        main_path = plugin_dir / "main.py"
-        entry_path = init_path if init_path.exists() else (main_path if main_path.exists() else None)
-        return entry_path
-
-    def install_plugin_dependencies(self, plugin_dir: Path):
-        req_file = plugin_dir / "requirements.txt"
-        pyproject_file = plugin_dir / "pyproject.toml"
-        setup_cfg_file = plugin_dir / "setup.cfg"
+        # scandir 的目录项自带类型信息，判断目录无需逐个 stat
+        with os.scandir(self.plugins_root) as entries:
+            plugin_dirs = [
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS and entry.is_dir()
+            ]
+
+        # 目录内容与上次成功加载时一致的插件直接复用结果；无法读取的插件目录只跳过该插件
+        fingerprints = await asyncio.to_thread(self._fingerprint_all, plugin_dirs)
+        results: Dict[Path, PluginDiscoveryResult] = {}
+        pending: Dict[Path, int] = {}
+        for plugin_dir, fingerprint in fingerprints.items():
+            cached = self._loaded.get(plugin_dir)
+            if cached is not None and cached[0] == fingerprint:
+                logger.info(f"Plugin {plugin_dir.name} unchanged, reusing loaded result")
+                results[plugin_dir] = cached[1]
+            else:
+                self._loaded.pop(plugin_dir, None)
+                pending[plugin_dir] = fingerprint
+
+        # 待加载插件的依赖合并为一次 pip 调用安装
+        installable = await self.install_dependencies(list(pending))
+
+        # PluginEnvironment 会替换全局 sys.modules / sys.path，插件必须在事件循环线程上逐个加载，
+        # 否则事件循环在此期间导入的模块会在环境退出时被丢弃；单个插件抛出的异常不影响其他插件
+        for plugin_dir in installable:
+            # 每个插件加载前让出一次事件循环，stop() 得以在插件之间生效
+            await asyncio.sleep(0)
+            try:
+                result = self._load_plugin_with_isolation(plugin_dir)
+            except Exception as e:
+                logger.error(f"❌ Failed to load plugin {plugin_dir.name}: {e}")
+                continue
+            if result is not None:
+                self._loaded[plugin_dir] = (pending[plugin_dir], result)
+                results[plugin_dir] = result
+
+        # 已删除或改名的插件目录：移除其模块查找器和已加载模块，不再保留加载结果
+        present = set(plugin_dirs)
+        for plugin_dir in [d for d in self._finders.keys() | self._loaded.keys() if d not in present]:
+            self._unload_previous(plugin_dir)
+            self._loaded.pop(plugin_dir, None)
+
+        # 每次发现得到完整的插件列表（按目录顺序），重复调用 start 不会产生重复项
+        self.plugins = [results[d] for d in plugin_dirs if d in results]
+
+    def _fingerprint_all(self, plugin_dirs: List[Path]) -> Dict[Path, int]:
+        """逐个计算插件目录指纹，读取失败的插件记录错误后跳过，不影响其他插件"""
+        fingerprints = {}
+        for plugin_dir in plugin_dirs:
+            try:
+                fingerprints[plugin_dir] = self._fingerprint(plugin_dir)
+            except OSError as e:
+                logger.error(f"❌ Failed to load plugin {plugin_dir.name}: {e}")
+        return fingerprints
+
+    @staticmethod
+    def _fingerprint(plugin_dir: Path) -> int:
+        """按文件路径、修改时间和大小计算目录指纹"""
+        stats = []
+        root = str(plugin_dir)
+        pending = [root]
+        while pending:
+            dir_path = pending.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                # 插件根目录无法读取时由调用方跳过整个插件；无法读取的子目录不参与指纹
+                if dir_path == root:
+                    raise
+                continue
+            for entry in entries:
+                # 不跟随符号链接：失效链接不会报错，目录链接成环也不会无限遍历
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                            pending.append(entry.path)
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        stats.append((entry.path, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    continue
+        stats.sort()
+        return hash(tuple(stats))
+
+    @staticmethod
+    def _file_names(plugin_dir: Path) -> Set[str]:
+        """一次读取目录项，入口文件、依赖文件的存在性检查都基于该结果，无需逐个 stat"""
+        with os.scandir(plugin_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+
+    def _load_plugin_initializer(self, plugin_dir: Path, names: Optional[Set[str]] = None) -> Optional[Path]:
+        if names is None:
+            names = self._file_names(plugin_dir)
+        for name in ("__init__.py", "main.py"):
+            if name in names:
+                return plugin_dir / name
+        return None
+
+    @staticmethod
+    def _check_setup_cfg(plugin_dir: Path, names: Set[str]):
         # pip cache purge
         # 检查 setup.cfg 里是否有非法依赖
-        if setup_cfg_file.exists():
-            with open(setup_cfg_file, "r") as f:
+        if "setup.cfg" in names:
+            with open(plugin_dir / "setup.cfg", "r") as f:
                 for i, line in enumerate(f, 1):
                     if ":none:" in line:
                         logger.error(f"Error: Invalid dependency ':none:' found in setup.cfg at line {i}")
                         raise ValueError("Invalid dependency ':none:' found in setup.cfg. Please remove it.")
 
+    @staticmethod
+    def _pip_install_args(plugin_dir: Path, names: Set[str]) -> List[str]:
+        if "requirements.txt" in names:
+            return ["-r", str(plugin_dir / "requirements.txt")]
+        if "pyproject.toml" in names:
+            return [str(plugin_dir)]
+        return []
+
+    def install_plugin_dependencies(self, plugin_dir: Path) -> bool:
+        """安装单个插件的依赖，没有需要安装的依赖或安装成功时返回 True"""
+        names = self._file_names(plugin_dir)
+        self._check_setup_cfg(plugin_dir, names)
+        args = self._pip_install_args(plugin_dir, names)
+        if not args:
+            return True
         try:
-            if req_file.exists():
-                logger.info(f"Installing requirements.txt for {plugin_dir.name}")
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "-r", str(req_file)])
-            elif pyproject_file.exists():
-                logger.info(f"Installing pyproject.toml for {plugin_dir.name}")
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", str(plugin_dir)])
+            logger.info(f"Installing dependencies for {plugin_dir.name}")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", *args])
+            return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Dependency installation failed for {plugin_dir.name}: {e}")
             # raise
+            return False
+
+    async def install_dependencies(self, plugin_dirs: List[Path]) -> List[Path]:
+        """
+        一次 pip 调用安装多个插件的依赖，返回通过 setup.cfg 校验、可以继续加载的插件目录。
+        依赖文件和解释器与上次安装成功时相同的插件不再调用 pip。
+        合并安装失败时逐个插件重试，以便定位出错的插件；依赖安装失败不阻止插件加载。
+        pip 以异步子进程运行，不占用事件循环和工作线程；多个 pip 同时写 site-packages 不安全，重试也逐个进行
+        """
+        cache = self._get_dependency_cache()
+        valid, targets, args = [], [], []
+        for plugin_dir in plugin_dirs:
+            try:
+                names = self._file_names(plugin_dir)
+                self._check_setup_cfg(plugin_dir, names)
+                # 没有入口文件的目录不是插件，无需安装依赖
+                plugin_args = self._pip_install_args(plugin_dir, names)
+                if not plugin_args or self._load_plugin_initializer(plugin_dir, names) is None:
+                    valid.append(plugin_dir)
+                    continue
+                fingerprint = self._dependency_fingerprint(plugin_dir, names)
+            except (OSError, ValueError) as e:
+                # 单个插件的依赖文件无法读取或校验失败时只跳过该插件
+                logger.error(f"❌ Failed to load plugin {plugin_dir.name}: {e}")
+                continue
+            valid.append(plugin_dir)
+            if cache.get(plugin_dir.name) == fingerprint:
+                logger.debug(f"Dependencies of {plugin_dir.name} unchanged, skipping pip")
+                continue
+            targets.append((plugin_dir, fingerprint, plugin_args))
+            args.extend(plugin_args)
+
+        if args:
+            logger.info(f"Installing dependencies for {len(targets)} plugins")
+            if await self._run_pip(args):
+                installed = targets
+            else:
+                logger.warning("Batched dependency installation failed, retrying per plugin")
+                installed = []
+                for target in targets:
+                    if await self._run_pip(target[2]):
+                        installed.append(target)
+            if installed:
+                cache.update((plugin_dir.name, fingerprint) for plugin_dir, fingerprint, _ in installed)
+                self._save_dependency_cache()
+        return valid
+
+    @staticmethod
+    async def _run_pip(args: List[str]) -> bool:
+        process = await asyncio.create_subprocess_exec(sys.executable, "-m", "pip", "install", "--upgrade", *args)
+        try:
+            return_code = await process.wait()
+        except asyncio.CancelledError:
+            # 发现流程被取消时不留下孤立的 pip 进程
+            process.kill()
+            await process.wait()
+            raise
+        if return_code != 0:
+            logger.error(f"pip install exited with code {return_code}: {' '.join(args)}")
+            return False
+        return True
+
+    @staticmethod
+    def _dependency_fingerprint(plugin_dir: Path, names: Set[str]) -> str:
+        """依赖文件内容加上当前解释器，任一变化都需要重新安装"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(sys.executable.encode("utf-8"))
+        digest.update(sys.version.encode("utf-8"))
+        for name in ("requirements.txt", "pyproject.toml"):
+            if name in names:
+                digest.update(name.encode("utf-8"))
+                digest.update((plugin_dir / name).read_bytes())
+        return digest.hexdigest()
+
+    def _get_dependency_cache(self) -> Dict[str, str]:
+        if self._dependency_cache is None:
+            try:
+                cache = json_loads((self.plugins_root / DEPENDENCY_CACHE_FILE).read_bytes())
+            except (OSError, ValueError):
+                cache = None
+            self._dependency_cache = cache if isinstance(cache, dict) else {}
+        return self._dependency_cache
+
+    def _save_dependency_cache(self):
+        # 先写临时文件再替换，中途失败不会留下半个文件
+        cache_file = self.plugins_root / DEPENDENCY_CACHE_FILE
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            tmp_file.write_bytes(json_dumps(self._dependency_cache))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save dependency cache {cache_file}: {e}")
 
-    def _load_plugin_with_isolation(self, plugin_dir: Path):
+    def _load_plugin_with_isolation(self, plugin_dir: Path) -> Optional[PluginDiscoveryResult]:
         """Load plugin in an isolated environment"""
+        # stop() 可能在 start() 让出事件循环期间被调用
+        if self.stopped:
+            return None
         plugin_name = plugin_dir.name
         logger.info(f"Starting to load plugin: {plugin_name}")
 
         # Check for __init__.py
         init_path = self._load_plugin_initializer(plugin_dir)
-        if not init_path.exists():
+        if init_path is None:
             # logger_handler.debug(f"Skipping plugin {plugin_name}: no __init__.py file")
             logger.warning(f"❌ Skipping plugin {plugin_name}: missing __init__.py or main.py file")
-            return
-
-        # Install dependencies
-        self.install_plugin_dependencies(plugin_dir=plugin_dir)
+            return None
 
         # Create plugin environment
+        # 必须在进入插件环境之前清理，环境退出时会恢复进入时的 sys.modules
+        self._unload_previous(plugin_dir)
         with PluginEnvironment(plugin_dir) as env:
             try:
-                # Preload all plugin modules into a separate namespace
-                self._preload_plugin_modules(plugin_dir, env.module_prefix)
+                # Plugin-namespaced modules are rewritten and loaded on first import
+                finder = PluginModuleFinder(plugin_dir, env.module_prefix)
+                sys.meta_path.insert(0, finder)
+                self._finders[plugin_dir] = finder
 
                 # Load main module
                 module_name = f"{env.module_prefix}_main"
                 spec = importlib.util.spec_from_file_location(module_name, init_path)
                 plugin_module = importlib.util.module_from_spec(spec)
 
-                # Execute main module
-                spec.loader.exec_module(plugin_module)
+                # Execute main module; registered first, as importlib does, so an import
+                # of the entry module during its own execution finds this instance
                 sys.modules[module_name] = plugin_module
+                try:
+                    spec.loader.exec_module(plugin_module)
+                except BaseException:
+                    sys.modules.pop(module_name, None)
+                    raise
 
                 # Get plugin classes
                 plugin_classes = []
-                if hasattr(plugin_module, "__all__"):
-                    for cls_name in plugin_module.__all__:
-                        if hasattr(plugin_module, cls_name):
-                            plugin_class = getattr(plugin_module, cls_name)
-                            logger.debug(f"   Loading plugin class: {cls_name}")
-                            plugin_classes.append(plugin_class)
-
-                self.plugins.append(
-                    PluginDiscoveryResult(
-                        path=str(plugin_dir.resolve()),
-                        entry_file=init_path,
-                        plugin_classes=plugin_classes,
-                    )
-                )
+                for cls_name in getattr(plugin_module, "__all__", ()):
+                    plugin_class = getattr(plugin_module, cls_name, _MISSING)
+                    if plugin_class is not _MISSING:
+                        logger.debug(f"   Loading plugin class: {cls_name}")
+                        plugin_classes.append(plugin_class)
+
                 logger.info(f"✅ Successfully loaded plugin: {plugin_name}")
+                return PluginDiscoveryResult(
+                    path=env.plugin_path,
+                    entry_file=init_path,
+                    plugin_classes=plugin_classes,
+                )
 
             except Exception as e:
-                logger.error(f"❌ Failed to load plugin {plugin_name}: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                # 一条记录同时带上堆栈，不再单独格式化 traceback
+                logger.error(f"❌ Failed to load plugin {plugin_name}: {e}", exc_info=True)
+                return None
+
+    def _unload_previous(self, plugin_dir: Path):
+        """插件重新加载前移除上一次加载注册的查找器，以及之后按需加载的插件模块"""
+        previous = self._finders.pop(plugin_dir, None)
+        if previous is None:
+            return
+        try:
+            sys.meta_path.remove(previous)
+        except ValueError:
+            pass
+        for name in previous.loaded_modules:
+            sys.modules.pop(name, None)
+        sys.modules.pop(f"{previous.module_prefix}_main", None)
 
     async def reload(self):
         """Reload all plugins"""
-        import warnings
         warnings.warn("PluginDiscovery.reload expired there are compatibility issues", DeprecationWarning)
-        self.plugins = []
+        # start 只重新加载目录有变化的插件，并重建 self.plugins
         await self.start()
 
-    def _preload_plugin_modules(self, plugin_dir: Path, module_prefix: str):
-        """Preload all plugin modules into a separate namespace"""
-        rewriter = PluginModuleRewriter(plugin_dir, module_prefix)
-
-        # Scan all Python files
-        for root, dirs, files in os.walk(plugin_dir):
-            for file in files:
-                if file.endswith('.py') and (file != '__init__.py' or file != 'main.py'):
-                    file_path = Path(root) / file
-                    rel_path = file_path.relative_to(plugin_dir)
-
-                    # Build module name
-                    module_parts = list(rel_path.parts[:-1]) + [rel_path.stem]
-                    module_name = f"{module_prefix}.{'.'.join(module_parts)}"
-
-                    try:
-                        # Load module using rewriter
-                        module = rewriter.rewrite_imports_and_load(file_path, module_name)
-                        sys.modules[module_name] = module
-                    except Exception as e:
-                        logger.warning(f"Preloading module {module_name} failed: {e}")
-
-                # Handle package __init__.py
-                elif file == '__init__.py' or file == 'main.py':
-                    dir_path = Path(root)
-                    if dir_path != plugin_dir:  # Skip root __init__.py
-                        rel_path = dir_path.relative_to(plugin_dir)
-                        module_name = f"{module_prefix}.{'.'.join(rel_path.parts)}"
-
-                        try:
-                            module = rewriter.rewrite_imports_and_load(
-                                dir_path / file, module_name
-                            )
-                            sys.modules[module_name] = module
-                        except Exception as e:
-                            logger.warning(f"Preloading package {module_name} failed: {e}")
-
 
 def safe_call_method(instance, method_name, *args, **kwargs):
     """Safely call instance method"""
-    if not hasattr(instance, method_name):
+    method = getattr(instance, method_name, _MISSING)
+    if method is _MISSING:
         return {'success': False, 'error': f'Method {method_name} not found'}
 
     try:
-        method = getattr(instance, method_name)
         if not callable(method):
             return {'success': False, 'error': f'{method_name} is not callable'}
 
@@ -3,6 +3,7 @@ Plugin Loader
 Responsible for dynamically loading and instantiating plugin modules
 """
 import datetime
+import itertools
 from pathlib import Path
 from typing import Optional, Any, Dict, List
 
@@ -17,6 +18,9 @@ from src.core.plugin import PluginValidator
 # Configure logger_handler
 logger = get_logger("PluginLoader")
 
+# 区分“属性不存在”与“属性值为 None”，一次 getattr 替代 hasattr + getattr
+_MISSING = object()
+
 
 class PluginLoadConfig(BaseModel):
     """Configuration for plugin loading operations"""
@@ -64,6 +68,7 @@ class PluginLoader:
                     plugin_service.instance = instance
                     plugin_service.functions = functions
                     plugin_service.config = config
+                    plugin_service.resolve_functions()
                     services.append(plugin_service)
 
             plugin_info = PluginRegistration(
@@ -74,6 +79,7 @@ class PluginLoader:
                 load_status="loaded",
                 registered_at=datetime.datetime.now(tz=datetime.timezone.utc).replace(microsecond=0).isoformat()
             )
+            plugin_info.compile_functions()
             return plugin_info
         except Exception as e:
             logger.error(f"Error loading plugin from {plugin.path}: {str(e)}")
@@ -139,34 +145,37 @@ class PluginLoader:
 
     def _load_instance(self, class_obj: Any) -> Any | None:
         try:
-            if hasattr(class_obj, "GET_PLUGIN"):
-                get_plugin = getattr(class_obj, "GET_PLUGIN")
-                if callable(get_plugin):
-                    invoke_fun = get_plugin()
-                    if isinstance(invoke_fun, dict) and 'instance' in invoke_fun:
-                        return invoke_fun['instance']
+            get_plugin = getattr(class_obj, "GET_PLUGIN", _MISSING)
+            if get_plugin is not _MISSING and callable(get_plugin):
+                invoke_fun = get_plugin()
+                if isinstance(invoke_fun, dict) and 'instance' in invoke_fun:
+                    return invoke_fun['instance']
         except Exception as e:
             logger.warning(f"Failed to load instance from class {class_obj}: {str(e)}")
         return None
 
     def _load_dependencies(self, plugin_path: str, metadata: dict) -> List[str]:
         dependencies = metadata.get("project", {}).get("dependencies", [])
+        file_dependencies = []
 
         requirements_file = Path(plugin_path) / "requirements.txt"
         if requirements_file.exists():
             try:
-                with requirements_file.open("r") as f:
-                    file_dependencies = [line.strip() for line in f if line.strip() and not line.startswith("#")]
-                    dependencies.extend(file_dependencies)
+                # 一次读入后按行切分，每行只 strip 一次
+                file_dependencies = [
+                    line for line in map(str.strip, requirements_file.read_text().splitlines())
+                    if line and not line.startswith("#")
+                ]
                 logger.debug(f"Loaded dependencies from requirements.txt: {file_dependencies}")
             except Exception as e:
                 logger.warning(f"Failed to read requirements.txt from {plugin_path}: {str(e)}")
-        return list(set(dependencies))
+        # 保持声明顺序去重；不修改 metadata 中的列表，解析结果可能被多个读取方共享
+        return list(dict.fromkeys(itertools.chain(dependencies, file_dependencies)))
 
     def _load_functions(self, class_obj: Any) -> Any | None:
         try:
-            if hasattr(class_obj, "FUNCTIONS"):
-                funcs = getattr(class_obj, "FUNCTIONS")
+            funcs = getattr(class_obj, "FUNCTIONS", _MISSING)
+            if funcs is not _MISSING:
                 return funcs
         except Exception as e:
             logger.warning(f"Failed to load functions from class {class_obj}: {str(e)}")
@@ -174,8 +183,8 @@ class PluginLoader:
 
     def _load_config(self, class_obj: Any) -> Dict[str, Any]:
         try:
-            if hasattr(class_obj, "PLUGIN_CONFIG"):
-                conf = getattr(class_obj, "PLUGIN_CONFIG")
+            conf = getattr(class_obj, "PLUGIN_CONFIG", _MISSING)
+            if conf is not _MISSING:
                 if callable(conf):
                     config_data = conf()
                 else:
@@ -3,9 +3,10 @@ Plugin Manager
 Responsible for the overall lifecycle management of plugins, including discovery, loading, starting, stopping, etc.
 """
 import asyncio
+import warnings
 from asyncio import iscoroutinefunction
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from src.core.config import get_plugin_config, PluginConfig, get_logger
 from src.core.plugin import PluginDiscovery, PluginLoader, PluginRegistry
@@ -25,6 +26,16 @@ class PluginManager:
         self.loader = PluginLoader()
         self.registry = PluginRegistry()
         self._running = False
+        # 插件安装/卸载/重载后调用的回调，例如让路由器的可用插件缓存失效
+        self._change_listeners: List[Callable[[], None]] = []
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """注册插件集合变化时的回调"""
+        self._change_listeners.append(listener)
+
+    def _notify_changed(self) -> None:
+        for listener in self._change_listeners:
+            listener()
 
     async def start(self):
         """Start the plugin manager"""
@@ -37,13 +48,13 @@ class PluginManager:
             for plugin_result in self.discovery.plugins:
                 plugin_registration = self.loader.load_plugin(plugin_result)
                 self.registry.register(plugin_registration)
+            self._notify_changed()
 
         # Start health check
         asyncio.create_task(self._health_check_loop())
 
     async def reload(self):
         """Reload all plugins"""
-        import warnings
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         LOGGER.info("Reloading all plugins")
         await self.registry.clean_all()
@@ -53,6 +64,7 @@ class PluginManager:
             for plugin_result in self.discovery.plugins:
                 plugin_registration = self.loader.load_plugin(plugin_result)
                 self.registry.register(plugin_registration)
+        self._notify_changed()
 
     async def stop(self):
         """Stop the plugin manager"""
@@ -69,6 +81,7 @@ class PluginManager:
             if plugin_result.path == plugin_path:
                 plugin_registration = self.loader.load_plugin(plugin_result)
                 self.registry.register(plugin_registration)
+                self._notify_changed()
                 return True
         return False
 
@@ -77,6 +90,7 @@ class PluginManager:
         try:
             # Remove from registry
             await self.registry.unregister(plugin_id)
+            self._notify_changed()
             LOGGER.info(f"Plugin {plugin_id} uninstalled successfully")
             return True
         except Exception as e:
@@ -89,7 +103,7 @@ class PluginManager:
         try:
             services: List[PluginInfoProviderDefinition] = plugin.plugin_services
             for service in services:
-                functions = service.functions() if callable(service.functions) else service.functions
+                functions = service.resolve_functions()
                 for fun in functions:
                     if method_name == (fun.get('name') if isinstance(fun, dict) else getattr(fun, 'name', None)):
                         # Whether await is needed depends on whether the method itself is a coroutine function or not
@@ -132,6 +146,10 @@ class PluginManager:
                 available_plugins.append(plugin)
         return available_plugins
 
+    async def snapshot(self) -> Dict[str, PluginRegistration]:
+        """Available plugins indexed by id"""
+        return {plugin.id: plugin for plugin in await self.list_available_plugins()}
+
     async def _health_check_loop(self):
         """Periodic health check for all plugins"""
         pass
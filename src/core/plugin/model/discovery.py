@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, List
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginDiscoveryResult:
     """Result of plugin discovery process"""
     path: str  # Plugin directory path
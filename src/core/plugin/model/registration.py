@@ -4,10 +4,13 @@ Contains models related to plugin registration and metadata
 """
 import uuid
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from src.core.config import get_logger
 from .service import PluginInfoProviderDefinition
 
+logger = get_logger(__name__)
+
 
 @dataclass
 class Author:
@@ -71,6 +74,32 @@ class PluginRegistration:
     error: Optional[str] = None  # Load failure reason
     registered_at: Optional[str] = None  # Registration timestamp
     is_enabled: bool = True  # Whether plugin is enabled
+    compiled_functions: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)  # Function specs of all services
+
+    def compile_functions(self) -> List[Dict[str, Any]]:
+        """Flatten the functions of all services into AI-facing specs once and cache them"""
+        if self.compiled_functions is None:
+            prefix = f"{self.name}."
+            compiled = []
+            for service in self.plugin_services:
+                for func in service.resolve_functions():
+                    if not isinstance(func, dict):
+                        continue
+                    try:
+                        name = func.get("name")
+                        if not name:
+                            continue
+                        compiled.append({
+                            "name": name,
+                            "description": func.get("description", ""),
+                            "input_schema": func.get("input_schema", {}),
+                            "full_method_name": prefix + name
+                        })
+                    except Exception as e:
+                        # A malformed spec skips only that function, not the whole plugin
+                        logger.warning(f"Skipping invalid function spec {func!r} of plugin {self.name}: {e}")
+            self.compiled_functions = compiled
+        return self.compiled_functions
 
     @property
     def name(self):
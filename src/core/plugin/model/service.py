@@ -3,7 +3,12 @@ Plugin Service Models
 Contains models related to plugin service definitions
 """
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from src.core.config import get_logger
+from src.core.utils.json_utils import json_loads
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -12,3 +17,20 @@ class PluginInfoProviderDefinition:
     instance: Any = None  # Plugin instance
     config: Dict[str, Any] = field(default_factory=dict)  # Plugin configuration (e.g., PLUGIN_CONFIG)
     functions: Optional[Dict[str, Any]] = None  # Plugin function list, JSON object
+    resolved_functions: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)  # Normalized function list
+
+    def resolve_functions(self) -> List[Dict[str, Any]]:
+        """Normalize `functions` (callable, list or JSON string) into a list once and cache it"""
+        if self.resolved_functions is None:
+            functions = self.functions
+            try:
+                if functions and callable(functions):
+                    functions = functions()
+                elif functions and isinstance(functions, str):
+                    functions = json_loads(functions)
+            except Exception as e:
+                # Only this service loses its functions; the rest of the plugin still loads
+                logger.warning(f"Failed to resolve functions of {self.instance}: {e}")
+                functions = None
+            self.resolved_functions = functions if isinstance(functions, list) else []
+        return self.resolved_functions
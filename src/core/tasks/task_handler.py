@@ -37,7 +37,7 @@ class TaskHandler:
                 return {
                     "success": False,
                     "error": plan_result.error or "Plan generation failed",
-                    "plan_result": plan_result.__dict__
+                    "plan_result": plan_result.to_dict()
                 }
 
             task_id = str(uuid.uuid4())
@@ -73,7 +73,7 @@ class TaskHandler:
             return {
                 "success": False,
                 "error": f"Failed to create task: {str(e)}",
-                "plan_result": plan_result.__dict__ if 'plan_result' in locals() else None
+                "plan_result": plan_result.to_dict() if 'plan_result' in locals() else None
             }
 
     async def query_tasks(self, query: TaskQuery) -> PaginatedTaskResponse:
@@ -1,5 +1,7 @@
-from .json_utils import JsonValidator
+from .json_utils import JsonValidator, json_dumps, json_loads
 
 __all__ = [
-    "JsonValidator"
+    "JsonValidator",
+    "json_dumps",
+    "json_loads"
 ]
@@ -1,4 +1,49 @@
+import dataclasses
+import functools
 import json
+from datetime import date, datetime, time
+from enum import Enum
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，调用方的异常处理无需改动
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_default(obj):
+    """orjson / json 无法直接序列化的类型"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # 以下类型 orjson 原生支持，仅 json 回退路径需要
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_stdlib_encoder = json.JSONEncoder(default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def _stdlib_json_dumps(obj) -> bytes:
+    return _stdlib_encoder.encode(obj).encode("utf-8")
+
+# 序列化为 UTF-8 字节，直接用作响应体；参数在模块加载时绑定一次，所有调用方共享。
+# OPT_NON_STR_KEYS 与 json 行为一致：插件返回的 int 等非字符串键转为字符串
+json_dumps = (
+    functools.partial(orjson.dumps, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    if orjson is not None else _stdlib_json_dumps
+)
 
 
 class JsonValidator:
@@ -22,7 +67,7 @@ class JsonValidator:
             return False
 
         try:
-            json.loads(content)
+            json_loads(content)
             return True
         except (json.JSONDecodeError, ValueError):
             return False
@@ -9,6 +9,9 @@ from .environment import PluginEnvironment
 # Import module rewriting utilities
 from .module_rewriter import PluginModuleRewriter
 
+# Import lazy module finder
+from .module_finder import PluginModuleFinder
+
 # Import metadata reading utilities
 from .metadata_reader import ProjectMetadataReader
 
@@ -19,6 +22,7 @@ __all__ = [
 
     # Module Rewriting
     'PluginModuleRewriter',
+    'PluginModuleFinder',
 
     # Metadata Reading
     'ProjectMetadataReader',
@@ -20,6 +20,7 @@ class PluginEnvironment:
         self.plugin_name = plugin_dir.name
         self.original_modules = {}
         self.original_path = []
+        self.plugin_path = None  # Resolved plugin directory, set on enter
         self.module_prefix = f"plugin_{self.plugin_name.replace('-', '_')}_{uuid.uuid4().hex[:8]}"
         self.lock = threading.Lock()
 
@@ -31,7 +32,7 @@ class PluginEnvironment:
             self.original_path = sys.path.copy()
 
             # Set plugin-specific module search path
-            plugin_path = str(self.plugin_dir.resolve())
+            self.plugin_path = plugin_path = str(self.plugin_dir.resolve())
 
             # Clean up potentially conflicting modules
             self._backup_conflicting_modules()
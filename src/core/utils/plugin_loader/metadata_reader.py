@@ -3,6 +3,7 @@ Plugin Metadata Reader
 Handles reading and parsing of plugin metadata from configuration files
 """
 import datetime
+import functools
 import tomllib
 from pathlib import Path
 from typing import Dict, Any, List
@@ -12,6 +13,13 @@ from src.core.config import get_logger
 logger = get_logger("metadata_reader")
 
 
+@functools.lru_cache(maxsize=256)
+def _read_pyproject(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse pyproject.toml; keyed on mtime and size so an edited file is parsed again"""
+    with open(path, "rb") as fp:
+        return tomllib.load(fp)
+
+
 class ProjectMetadataReader:
     """
     Metadata Extractor
@@ -49,13 +57,15 @@ class ProjectMetadataReader:
     @staticmethod
     def _load(plugin_path: str | Path) -> Dict[str, Any]:
         path = Path(plugin_path, "pyproject.toml")
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             logger.warning(f"pyproject.toml not found at path: {path}")
             return {}
 
         try:
-            with path.open("rb") as fp:
-                data = tomllib.load(fp)
+            # Parsed data is shared between readers of the same file version and must not be mutated
+            data = _read_pyproject(str(path), stat.st_mtime_ns, stat.st_size)
 
             logger.debug(f"Successfully loaded metadata from: {path}")
             return {
@@ -0,0 +1,127 @@
+"""
+Plugin Module Finder
+Resolves plugin-namespaced imports lazily on first access
+"""
+import importlib.abc
+import importlib.machinery
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.core.config import get_logger
+from .module_rewriter import PluginModuleRewriter
+
+logger = get_logger("module_finder")
+
+_UNSET = object()
+
+# Importable names that hold tooling or build artifacts rather than plugin code
+_PRUNED_DIRS = frozenset({'__pycache__', 'node_modules', 'venv'})
+
+
+class PluginModuleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Map '<module_prefix>.x.y' imports to files in the plugin directory and load them on demand"""
+
+    def __init__(self, plugin_dir: Path, module_prefix: str):
+        self.plugin_dir = plugin_dir
+        self.module_prefix = module_prefix
+        # find_spec runs for every import not yet in sys.modules, so keep the check allocation-free
+        self._prefix_dot = module_prefix + '.'
+        self._prefix_len = len(self._prefix_dot)
+        self.rewriter = PluginModuleRewriter(plugin_dir, module_prefix)
+        # Built on the first import under the prefix; plugins that never import it skip the scan
+        self._index: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None
+        self._local_import_pattern = _UNSET
+        # Names of every module this finder has executed, so unloading needs no sys.modules scan
+        self.loaded_modules: List[str] = []
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == self.module_prefix:
+            # Plugin root acts as a namespace package; its entry file is loaded separately
+            spec = importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+            spec.submodule_search_locations = [str(self.plugin_dir)]
+            return spec
+        if not fullname.startswith(self._prefix_dot):
+            return None
+
+        entry = self._get_index().get(fullname[self._prefix_len:])
+        if entry is None:
+            return None
+        origin, package_dir = entry
+        spec = importlib.machinery.ModuleSpec(fullname, self, origin=origin, is_package=package_dir is not None)
+        if package_dir is not None:
+            spec.submodule_search_locations = [package_dir]
+        spec.has_location = origin is not None
+        return spec
+
+    def _get_index(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Dotted name -> (source file, package directory), built from one scan of the plugin tree"""
+        if self._index is None:
+            self._index = self._scan()
+        return self._index
+
+    def _scan(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        index = {}
+        # Explicit stack instead of recursion; directory symlinks are not followed, so a link
+        # pointing back up the plugin tree cannot send the scan round in a loop
+        stack = [(str(self.plugin_dir), '')]
+        while stack:
+            dir_path, dotted = stack.pop()
+            modules, packages = {}, []
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Directories that can never be imported (.git, .venv, ...) are not descended into
+                        if entry.name.isidentifier() and entry.name not in _PRUNED_DIRS:
+                            packages.append(entry)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        modules[entry.name[:-3]] = entry.path
+
+            for package in packages:
+                name = dotted + package.name
+                init_file = os.path.join(package.path, '__init__.py')
+                if os.path.isfile(init_file):
+                    index[name] = (init_file, package.path)
+                elif package.name in modules:
+                    # Same precedence as the path finder: package with __init__, then module, then namespace
+                    continue
+                else:
+                    index[name] = (None, package.path)
+                stack.append((package.path, name + '.'))
+            for stem, file_path in modules.items():
+                if stem != '__init__':
+                    index.setdefault(dotted + stem, (file_path, None))
+        return index
+
+    def _get_local_import_pattern(self) -> Optional[re.Pattern]:
+        """Matches import lines naming a top-level plugin module, i.e. lines the rewriter may change"""
+        if self._local_import_pattern is _UNSET:
+            names = sorted((name for name, (origin, _) in self._get_index().items()
+                            if '.' not in name and origin is not None), key=len, reverse=True)
+            self._local_import_pattern = re.compile(
+                rb'^[ \t]*(?:from|import)[ \t]+(?:' + b'|'.join(re.escape(n.encode('utf-8')) for n in names) + rb')\b',
+                re.MULTILINE) if names else None
+        return self._local_import_pattern
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        self.loaded_modules.append(module.__name__)
+        origin = module.__spec__.origin
+        if origin is None:
+            return
+        file_path = Path(origin)
+        pattern = self._get_local_import_pattern()
+        if pattern is None or not pattern.search(file_path.read_bytes()):
+            # Nothing to rewrite: the standard loader reuses the bytecode in __pycache__
+            importlib.machinery.SourceFileLoader(module.__name__, origin).exec_module(module)
+            return
+        try:
+            code = self.rewriter.compile_rewritten(file_path)
+        except Exception as e:
+            # If rewriting fails, compile the original source
+            logger.warning(f"Failed to rewrite imports of {module.__name__}, loading original source: {e}")
+            code = compile(file_path.read_text(encoding='utf-8'), str(file_path), 'exec')
+        exec(code, module.__dict__)
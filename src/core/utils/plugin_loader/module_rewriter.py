@@ -3,8 +3,6 @@ Plugin Module Import Rewriter
 Handles dynamic rewriting of import statements in plugin modules
 """
 import importlib.util
-import os
-import tempfile
 from pathlib import Path
 
 from src.core.config import get_logger
@@ -19,33 +17,28 @@ class PluginModuleRewriter:
         self.plugin_dir = plugin_dir
         self.module_prefix = module_prefix
 
+    def compile_rewritten(self, file_path: Path):
+        """Rewrite import statements and compile the module source"""
+        # Read original file content
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_content = f.read()
+
+        # Rewrite import statements
+        rewritten_content = self._rewrite_import_statements(original_content)
+
+        # Compile rewritten source in memory; no temporary file round-trip,
+        # and tracebacks point at the original plugin file
+        return compile(rewritten_content, str(file_path), 'exec')
+
     def rewrite_imports_and_load(self, file_path: Path, module_name: str):
         """Rewrite import statements and load module"""
         try:
-            # Read original file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-
-            # Rewrite import statements
-            rewritten_content = self._rewrite_import_statements(original_content)
-
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as temp_file:
-                temp_file.write(rewritten_content)
-                temp_file_path = temp_file.name
-
-            try:
-                # Load module from temporary file
-                spec = importlib.util.spec_from_file_location(module_name, temp_file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                return module
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+            code = self.compile_rewritten(file_path)
+            spec = importlib.util.spec_from_loader(module_name, loader=None, origin=str(file_path))
+            module = importlib.util.module_from_spec(spec)
+            module.__file__ = str(file_path)
+            exec(code, module.__dict__)
+            return module
 
         except Exception as e:
             # If rewriting fails, try loading original file directly
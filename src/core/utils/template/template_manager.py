@@ -4,6 +4,7 @@
 
 import os
 from pathlib import Path
+from string import Template
 from typing import Optional, List
 
 class TemplateManager:
@@ -11,6 +12,7 @@ class TemplateManager:
     def __init__(self, template_dir: str):
         self.template_dir = Path(template_dir)
         self._template_cache = {}
+        self._compiled_cache = {}
         self.template_dir.mkdir(parents=True, exist_ok=True)
 
     def load_template(self, template_name: str) -> Optional[str]:
@@ -26,6 +28,18 @@ class TemplateManager:
         self._template_cache[template_name] = content
         return content
 
+    def load_compiled_template(self, template_name: str) -> Optional[Template]:
+        """
+        读取模板并构建 Template 对象，按模板名缓存
+        """
+        template = self._compiled_cache.get(template_name)
+        if template is None:
+            content = self.load_template(template_name)
+            if content is None:
+                return None
+            template = self._compiled_cache[template_name] = Template(content)
+        return template
+
     def list_templates(self) -> List[str]:
         """
         列出所有可用模板名（不含后缀）
@@ -34,4 +48,5 @@ class TemplateManager:
 
     def clear_cache(self):
         self._template_cache.clear()
+        self._compiled_cache.clear()
 
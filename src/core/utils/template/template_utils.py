@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from string import Template
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from .template_manager import TemplateManager
 
@@ -34,14 +34,19 @@ class TemplateVariableProcessor:
         """
         渲染字符串模板
         """
-        template = Template(template_content)
+        return self.render_template(Template(template_content), variables)
+
+    def render_template(self, template: Template, variables: Dict[str, Any] = None) -> str:
+        """
+        渲染已构建的模板
+        """
         all_variables = self.get_global_variables()
         if variables:
             all_variables.update(variables)
         try:
             return template.safe_substitute(all_variables)
         except Exception:
-            return template_content
+            return template.template
 
 
 @dataclass
@@ -58,16 +63,42 @@ class EnhancedPromptTemplates:
     def __init__(self, template_dir: str, user_name: str = "Gordon"):
         self.template_manager = TemplateManager(template_dir)
         self.variable_processor = TemplateVariableProcessor(user_name)
+        # 最近一次插件目录及其文本：(目录列表对象, 文本)。路由器在缓存刷新前复用同一个列表对象
+        self._catalog_text: Optional[Tuple[list, str]] = None
 
     def render_prompt(self, template_name: str, variables: dict = None) -> str:
-        template_content = self.template_manager.load_template(template_name)
-        if not template_content:
+        template = self.template_manager.load_compiled_template(template_name)
+        if template is None or not template.template:
             return ""
-        return self.variable_processor.render_string_template(template_content, variables)
+        return self.variable_processor.render_template(template, variables)
+
+    def _render_catalog(self, plugins_basic_info: list) -> str:
+        cached = self._catalog_text
+        if cached is None or cached[0] is not plugins_basic_info:
+            cached = self._catalog_text = (plugins_basic_info, self._format_catalog(plugins_basic_info))
+        return cached[1]
+
+    @staticmethod
+    def _format_catalog(plugins_basic_info: list) -> str:
+        """
+        插件目录按列格式输出：表头只写一次字段名，每个插件一行，比逐条 JSON 少重复字段名
+        """
+        def cell(value) -> str:
+            # 分隔符和换行会破坏行结构
+            return " ".join(str(value or "").replace("|", "/").split())
+
+        rows = ["plugin_id|plugin_name|description|tags"]
+        rows.extend(
+            "|".join((cell(p.get("plugin_id")), cell(p.get("plugin_name")), cell(p.get("description")),
+                      ",".join(cell(tag) for tag in p.get("tags") or ())))
+            for p in plugins_basic_info
+        )
+        return "\n".join(rows)
 
     def get_plugin_selection_prompt(self, plugins_basic_info: list, user_input: str) -> PromptResponse:
         return PromptResponse(
-            system_prompt=self.render_prompt("plugin_selection", {"plugins_description": plugins_basic_info}),
+            system_prompt=self.render_prompt("plugin_selection",
+                                             {"plugins_description": self._render_catalog(plugins_basic_info)}),
             user_prompt=f"用户需求: {user_input}\n请分析用户意图，筛选出最适合的插件。"
         )
 
@@ -80,6 +111,15 @@ class EnhancedPromptTemplates:
             user_prompt=f"基于用户需求: {user_input}\n请从可用函数中选择合适的函数并生成执行计划JSON。"
         )
 
+    def get_selection_and_plan_prompt(self, plugins_with_functions: list, user_input: str) -> PromptResponse:
+        return PromptResponse(
+            system_prompt=self.render_prompt("selection_and_plan", {
+                "plugins_with_functions": plugins_with_functions,
+                "user_input": user_input
+            }),
+            user_prompt=f"用户需求: {user_input}\n请筛选合适的插件，并从中选择函数生成执行计划JSON。"
+        )
+
     def get_json_fix_prompt(self, invalid_json: str) -> PromptResponse:
         return PromptResponse(
             system_prompt=self.render_prompt("json_fix", {"invalid_json": invalid_json}),
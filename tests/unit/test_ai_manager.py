@@ -0,0 +1,61 @@
+"""
+AIManager 单元测试：相同的并发调用合并为一次请求
+"""
+import asyncio
+
+from src.core.ai.manager import AIManager
+from src.core.ai.providers.response import SelectionResponse
+
+
+def _manager(calls: list) -> AIManager:
+    # 跳过 __init__，不读取 AI 配置、不初始化真实的 provider
+    manager = AIManager.__new__(AIManager)
+    manager._inflight = {}
+
+    async def call_with_fallback(system_prompt, user_prompt, **kwargs):
+        calls.append((system_prompt, user_prompt, kwargs))
+        await asyncio.sleep(0)
+        return SelectionResponse.success_response(user_prompt)
+
+    manager._call_with_fallback = call_with_fallback
+    return manager
+
+
+async def _gather(manager: AIManager, *calls):
+    return await asyncio.gather(*(manager.call_with_fallback(*args, **kwargs) for args, kwargs in calls))
+
+
+def test_identical_concurrent_calls_share_one_request():
+    calls = []
+    manager = _manager(calls)
+
+    first, second = asyncio.run(_gather(manager, (("sys", "hi"), {"temperature": 0}), (("sys", "hi"), {"temperature": 0})))
+
+    assert len(calls) == 1
+    assert first is second
+    assert manager._inflight == {}
+
+
+def test_different_calls_are_not_coalesced():
+    calls = []
+    manager = _manager(calls)
+
+    asyncio.run(_gather(manager, (("sys", "hi"), {}), (("sys", "bye"), {})))
+
+    assert len(calls) == 2
+
+
+def test_unhashable_kwargs_call_through():
+    calls = []
+    manager = _manager(calls)
+
+    first, second = asyncio.run(_gather(
+        manager,
+        (("sys", "hi"), {"stop": ["\n"], "response_format": {"type": "json_object"}}),
+        (("sys", "hi"), {"stop": ["\n"], "response_format": {"type": "json_object"}}),
+    ))
+
+    assert len(calls) == 2
+    assert first.data == second.data == "hi"
+    assert calls[0][2] == {"stop": ["\n"], "response_format": {"type": "json_object"}}
+    assert manager._inflight == {}
@@ -0,0 +1,88 @@
+"""
+DIContainer 单元测试：预编译解析器、循环依赖检测与非类型注解
+"""
+import pytest
+
+from src.core.di.container import DIContainer
+
+
+class Repository:
+    pass
+
+
+class Service:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+class CycleA:
+    def __init__(self, b):
+        self.b = b
+
+
+class CycleB:
+    def __init__(self, a: CycleA):
+        self.a = a
+
+
+# CycleA 依赖 CycleB，定义之后再补上注解以构成循环
+CycleA.__init__.__annotations__['b'] = CycleB
+
+
+class WithForwardRef:
+    def __init__(self, dependency: "NotDefinedAnywhere" = None):  # noqa: F821
+        self.dependency = dependency
+
+
+class RequiresForwardRef:
+    def __init__(self, dependency: "NotDefinedAnywhere"):  # noqa: F821
+        self.dependency = dependency
+
+
+def test_transient_injects_registered_singleton():
+    container = DIContainer()
+    repository = Repository()
+    container.register_singleton(Repository, repository)
+    container.register_transient(Service, Service)
+
+    first, second = container.get(Service), container.get(Service)
+
+    assert first is not second
+    assert first.repository is repository
+    assert second.repository is repository
+
+
+def test_unregistered_class_is_auto_created():
+    service = DIContainer().get(Service)
+
+    assert isinstance(service, Service)
+    assert isinstance(service.repository, Repository)
+
+
+def test_registration_replaces_compiled_resolver():
+    container = DIContainer()
+    auto_created = container.get(Service)
+    registered = Service(Repository())
+    container.register_singleton(Service, registered)
+
+    assert container.get(Service) is registered
+    assert container.get(Service) is not auto_created
+
+
+def test_cyclic_dependency_is_not_registered():
+    with pytest.raises(ValueError):
+        DIContainer().get(CycleA)
+
+
+def test_forward_ref_annotation_falls_back_to_default():
+    assert DIContainer().get(WithForwardRef).dependency is None
+
+
+def test_forward_ref_annotation_without_default_raises_value_error():
+    with pytest.raises(ValueError):
+        DIContainer().get(RequiresForwardRef)
+
+
+def test_non_type_interface_raises_value_error():
+    with pytest.raises(ValueError):
+        DIContainer().get("Service")
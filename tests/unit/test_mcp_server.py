@@ -1,2 +1,128 @@
 # MCP Server Tests
+import asyncio
+import json
 
+from src.core.mcp.server import MCPServer
+from src.core.plugin.model import PluginInfoProviderDefinition, PluginRegistration
+
+
+class Calculator:
+    def add(self, a, b):
+        return a + b
+
+    async def mul(self, a, b):
+        return a * b
+
+    def raw(self):
+        return b"\x00\x01"
+
+
+class ReboundCalculator(Calculator):
+    """实例上把同步方法替换为协程函数，分发时必须按实际调用结果 await"""
+
+    def __init__(self):
+        self.add = self._async_add
+
+    async def _async_add(self, a, b):
+        return a + b
+
+
+class FakePluginManager:
+    def __init__(self, *plugins: PluginRegistration):
+        self.plugins = {plugin.id: plugin for plugin in plugins}
+
+    async def get_plugin_by_id(self, plugin_id):
+        return self.plugins.get(plugin_id)
+
+
+def _plugin(plugin_id: str, instance) -> PluginRegistration:
+    service = PluginInfoProviderDefinition(instance=instance, functions=[{"name": "add"}, {"name": "mul"}, {"name": "raw"}])
+    return PluginRegistration(path="", entry_file="__init__.py", plugin_services=[service], id=plugin_id)
+
+
+def _server() -> MCPServer:
+    return MCPServer(FakePluginManager(_plugin("calc", Calculator), _plugin("rebound", ReboundCalculator)))
+
+
+def _request(fun_name, rid=None, method="calc", **arguments):
+    request = {"jsonrpc": "2.0", "method": method, "params": {"fun_name": fun_name, "arguments": arguments}}
+    if rid is not None:
+        request["id"] = rid
+    return request
+
+
+def _handle(server: MCPServer, payload):
+    body = asyncio.run(server.handle(json.dumps(payload).encode("utf-8")))
+    return None if body is None else json.loads(body)
+
+
+def test_sync_and_async_methods():
+    server = _server()
+
+    assert _handle(server, _request("add", 1, a=1, b=2))["result"] == 3
+    assert _handle(server, _request("mul", 2, a=3, b=4))["result"] == 12
+
+
+def test_method_rebound_on_instance_is_awaited():
+    response = _handle(_server(), _request("add", 1, method="rebound", a=2, b=5))
+
+    assert response["result"] == 7
+
+
+def test_unknown_function_returns_method_not_found():
+    response = _handle(_server(), _request("div", 1, a=1, b=2))
+
+    assert response["error"]["code"] == -32601
+    assert response["id"] == 1
+
+
+def test_extra_members_are_ignored():
+    request = _request("add", 1, a=1, b=1)
+    request["meta"] = {"client": "lenient"}
+    request["params"]["trace"] = "abc"
+
+    assert _handle(_server(), request)["result"] == 2
+
+
+def test_unserializable_result_becomes_internal_error():
+    assert _handle(_server(), _request("raw", 1))["error"]["code"] == -32603
+
+
+def test_notification_returns_no_body():
+    assert _handle(_server(), _request("add", a=1, b=2)) is None
+
+
+def test_batch_keeps_order_and_skips_notifications():
+    responses = _handle(_server(), [
+        _request("add", "first", a=1, b=2),
+        _request("add", a=5, b=5),
+        5,
+        _request("mul", "last", a=2, b=3),
+    ])
+
+    assert [response["id"] for response in responses] == ["first", None, "last"]
+    assert responses[0]["result"] == 3
+    assert responses[1]["error"]["code"] == -32600
+    assert responses[2]["result"] == 6
+
+
+def test_unserializable_result_does_not_drop_batch():
+    responses = _handle(_server(), [_request("raw", "bad"), _request("add", "good", a=1, b=2)])
+
+    assert [response["id"] for response in responses] == ["bad", "good"]
+    assert responses[0]["error"]["code"] == -32603
+    assert responses[1]["result"] == 3
+
+
+def test_batch_of_notifications_returns_no_body():
+    assert _handle(_server(), [_request("add", a=1, b=2), _request("mul", a=1, b=2)]) is None
+
+
+def test_empty_batch_is_invalid_request():
+    assert _handle(_server(), [])["error"]["code"] == -32600
+
+
+def test_malformed_json_is_parse_error():
+    body = asyncio.run(_server().handle(b'{"jsonrpc": "2.0", '))
+
+    assert json.loads(body)["error"]["code"] == -32700
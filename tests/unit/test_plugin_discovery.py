@@ -0,0 +1,159 @@
+"""
+PluginDiscovery 单元测试：目录指纹复用、符号链接处理、单插件失败隔离、依赖指纹缓存与变更/已删除插件的清理
+"""
+import asyncio
+import importlib
+import os
+import shutil
+import sys
+
+import pytest
+
+from src.core.plugin.discovery import DEPENDENCY_CACHE_FILE, PluginDiscovery
+
+PLUGIN_ENTRY = """\
+from helper import greet
+
+
+class Greeter:
+    GREETING = greet()
+
+
+__all__ = ["Greeter", "Missing"]
+"""
+
+
+def _write_plugin(root, name, requirements=None):
+    plugin_dir = root / name
+    plugin_dir.mkdir()
+    (plugin_dir / "__init__.py").write_text(PLUGIN_ENTRY)
+    (plugin_dir / "helper.py").write_text(f"def greet():\n    return 'hello from {name}'\n")
+    if requirements is not None:
+        (plugin_dir / "requirements.txt").write_text(requirements)
+    return plugin_dir
+
+
+@pytest.fixture
+def discovery(tmp_path):
+    discovery = PluginDiscovery(plugins_root=str(tmp_path))
+    yield discovery
+    for plugin_dir in list(discovery._finders):
+        discovery._unload_previous(plugin_dir)
+
+
+@pytest.fixture
+def pip_calls(monkeypatch):
+    calls = []
+
+    async def run_pip(args):
+        calls.append(args)
+        return True
+
+    monkeypatch.setattr(PluginDiscovery, "_run_pip", staticmethod(run_pip))
+    return calls
+
+
+def test_start_loads_plugins_and_reuses_unchanged(tmp_path, discovery):
+    _write_plugin(tmp_path, "hello")
+
+    asyncio.run(discovery.start())
+    first = discovery.plugins
+    asyncio.run(discovery.start())
+
+    assert len(first) == 1
+    assert [cls.GREETING for cls in first[0].plugin_classes] == ["hello from hello"]
+    assert discovery.plugins[0] is first[0]
+
+
+def test_changed_plugin_is_reloaded_and_old_finder_removed(tmp_path, discovery):
+    plugin_dir = _write_plugin(tmp_path, "hello")
+    asyncio.run(discovery.start())
+    old_finder = discovery._finders[plugin_dir]
+    # 插件在调用期间按需导入的命名空间模块，重新加载时应一并移除
+    importlib.import_module(f"{old_finder.module_prefix}.helper")
+    old_modules = list(old_finder.loaded_modules)
+
+    (plugin_dir / "extra.py").write_text("")
+    asyncio.run(discovery.start())
+
+    assert old_modules
+    assert old_finder not in sys.meta_path
+    assert not any(name in sys.modules for name in old_modules)
+    assert discovery._finders[plugin_dir] is not old_finder
+
+
+def test_unreadable_plugin_does_not_abort_others(tmp_path, discovery, monkeypatch):
+    _write_plugin(tmp_path, "broken")
+    _write_plugin(tmp_path, "healthy")
+    fingerprint = PluginDiscovery._fingerprint
+
+    def failing_fingerprint(plugin_dir):
+        if plugin_dir.name == "broken":
+            raise PermissionError("permission denied")
+        return fingerprint(plugin_dir)
+
+    monkeypatch.setattr(PluginDiscovery, "_fingerprint", staticmethod(failing_fingerprint))
+    asyncio.run(discovery.start())
+
+    assert [os.path.basename(plugin.path) for plugin in discovery.plugins] == ["healthy"]
+
+
+def test_failing_plugin_module_does_not_abort_others(tmp_path, discovery):
+    (_write_plugin(tmp_path, "broken") / "__init__.py").write_text("raise RuntimeError('boom')\n")
+    _write_plugin(tmp_path, "healthy")
+
+    asyncio.run(discovery.start())
+
+    assert [os.path.basename(plugin.path) for plugin in discovery.plugins] == ["healthy"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_fingerprint_tolerates_dangling_links_and_loops(tmp_path):
+    plugin_dir = _write_plugin(tmp_path, "hello")
+    try:
+        os.symlink(tmp_path / "does-not-exist", plugin_dir / "dangling")
+        os.symlink(plugin_dir, plugin_dir / "loop", target_is_directory=True)
+    except OSError:
+        pytest.skip("cannot create symlinks")
+
+    before = PluginDiscovery._fingerprint(plugin_dir)
+    (plugin_dir / "helper.py").write_text("def greet():\n    return 'changed'\n")
+
+    assert PluginDiscovery._fingerprint(plugin_dir) != before
+
+
+def test_removed_plugin_is_unloaded(tmp_path, discovery):
+    plugin_dir = _write_plugin(tmp_path, "hello")
+    asyncio.run(discovery.start())
+    finder = discovery._finders[plugin_dir]
+
+    shutil.rmtree(plugin_dir)
+    asyncio.run(discovery.start())
+
+    assert discovery.plugins == []
+    assert finder not in sys.meta_path
+    assert plugin_dir not in discovery._finders
+    assert plugin_dir not in discovery._loaded
+
+
+def test_dependency_cache_skips_pip_when_unchanged(tmp_path, pip_calls):
+    plugin_dir = _write_plugin(tmp_path, "hello", requirements="# no third-party packages\n")
+
+    first = PluginDiscovery(plugins_root=str(tmp_path))
+    asyncio.run(first.start())
+    assert pip_calls == [["-r", str(plugin_dir / "requirements.txt")]]
+    assert (tmp_path / DEPENDENCY_CACHE_FILE).exists()
+
+    # 新实例从缓存文件读取依赖指纹，依赖文件未变化时不再调用 pip
+    second = PluginDiscovery(plugins_root=str(tmp_path))
+    asyncio.run(second.start())
+    assert len(pip_calls) == 1
+
+    (plugin_dir / "requirements.txt").write_text("# still nothing, but different\n")
+    third = PluginDiscovery(plugins_root=str(tmp_path))
+    asyncio.run(third.start())
+    assert len(pip_calls) == 2
+
+    for instance in (first, second, third):
+        for loaded_dir in list(instance._finders):
+            instance._unload_previous(loaded_dir)
@@ -0,0 +1,74 @@
+"""
+PluginModuleFinder 单元测试：插件命名空间导入、本地导入改写、目录符号链接与已加载模块记录
+"""
+import importlib
+import importlib.util
+import os
+import sys
+import uuid
+
+import pytest
+
+from src.core.utils.plugin_loader import PluginModuleFinder
+
+
+@pytest.fixture
+def finder(tmp_path):
+    finder = PluginModuleFinder(tmp_path, f"plugin_test_{uuid.uuid4().hex[:8]}")
+    sys.meta_path.insert(0, finder)
+    yield finder
+    sys.meta_path.remove(finder)
+    for name in finder.loaded_modules:
+        sys.modules.pop(name, None)
+
+
+def test_local_imports_are_rewritten(tmp_path, finder):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("VALUE = 1\n")
+    (tmp_path / "helper.py").write_text("from pkg import VALUE\nANSWER = VALUE + 41\n")
+
+    module = importlib.import_module(f"{finder.module_prefix}.helper")
+
+    assert module.ANSWER == 42
+    assert module.__file__ == str(tmp_path / "helper.py")
+    assert set(finder.loaded_modules) == {
+        finder.module_prefix, f"{finder.module_prefix}.helper", f"{finder.module_prefix}.pkg"}
+
+
+def test_namespace_packages_and_module_precedence(tmp_path, finder):
+    (tmp_path / "ns" / "deep").mkdir(parents=True)
+    (tmp_path / "ns" / "deep" / "leaf.py").write_text("NAME = 'leaf'\n")
+    # 同名的模块文件与无 __init__ 的目录并存时，与标准路径查找器一样模块优先
+    (tmp_path / "shadow").mkdir()
+    (tmp_path / "shadow.py").write_text("KIND = 'module'\n")
+
+    leaf = importlib.import_module(f"{finder.module_prefix}.ns.deep.leaf")
+    shadow = importlib.import_module(f"{finder.module_prefix}.shadow")
+
+    assert leaf.NAME == "leaf"
+    assert shadow.KIND == "module"
+
+
+def test_unknown_and_pruned_names_are_not_found(tmp_path, finder):
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "stale.py").write_text("")
+    importlib.import_module(finder.module_prefix)
+
+    assert importlib.util.find_spec(f"{finder.module_prefix}.missing") is None
+    assert finder.find_spec(f"{finder.module_prefix}.__pycache__.stale") is None
+    assert finder.find_spec("unrelated.module") is None
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_directory_symlinks_are_not_followed(tmp_path, finder):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    try:
+        os.symlink(tmp_path, tmp_path / "pkg" / "loop", target_is_directory=True)
+    except OSError:
+        pytest.skip("cannot create symlinks")
+
+    importlib.import_module(finder.module_prefix)
+
+    assert finder.find_spec(f"{finder.module_prefix}.pkg.mod") is not None
+    assert finder.find_spec(f"{finder.module_prefix}.pkg.loop") is None
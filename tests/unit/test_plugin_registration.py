@@ -0,0 +1,51 @@
+"""
+插件注册模型单元测试：函数描述编译时单个函数出错只跳过该函数
+"""
+from src.core.plugin.model import PluginInfoProviderDefinition, PluginMetadata, PluginRegistration, Project
+
+
+def _registration(*services: PluginInfoProviderDefinition) -> PluginRegistration:
+    return PluginRegistration(
+        path="",
+        entry_file="__init__.py",
+        plugin_services=list(services),
+        metadata=PluginMetadata(project=Project(name="calc", version="1.0.0")),
+    )
+
+
+def _broken_functions():
+    raise RuntimeError("broken FUNCTIONS")
+
+
+def test_compile_functions_skips_invalid_specs():
+    service = PluginInfoProviderDefinition(functions=[
+        {"name": "add", "description": "加法", "input_schema": {"type": "object"}},
+        {"name": 123},
+        {"description": "missing name"},
+        "not a spec",
+    ])
+
+    assert _registration(service).compile_functions() == [{
+        "name": "add",
+        "description": "加法",
+        "input_schema": {"type": "object"},
+        "full_method_name": "calc.add",
+    }]
+
+
+def test_failing_service_does_not_drop_other_services():
+    broken = PluginInfoProviderDefinition(functions=_broken_functions)
+    invalid_json = PluginInfoProviderDefinition(functions="[{not json")
+    working = PluginInfoProviderDefinition(functions='[{"name": "mul"}]')
+
+    compiled = _registration(broken, invalid_json, working).compile_functions()
+
+    assert broken.resolve_functions() == []
+    assert invalid_json.resolve_functions() == []
+    assert [func["full_method_name"] for func in compiled] == ["calc.mul"]
+
+
+def test_compile_functions_is_cached():
+    registration = _registration(PluginInfoProviderDefinition(functions=[{"name": "add"}]))
+
+    assert registration.compile_functions() is registration.compile_functions()
@@ -0,0 +1,81 @@
+"""
+TaskPlanner 单元测试：相同提示词的AI响应缓存与单插件时跳过AI筛选
+"""
+import asyncio
+import json
+from dataclasses import dataclass
+
+from src.core.ai.providers.response import SelectionResponse
+from src.core.orchestration.task_planner import TaskPlanner
+
+PLAN = {"analysis": "拍照", "selected_functions": [], "execution_order": [], "overall_confidence": 0.9}
+
+
+@dataclass
+class Prompt:
+    system_prompt: str
+    user_prompt: str
+
+
+class FakeTemplates:
+    def get_function_matching_prompt(self, plugin_functions, user_input):
+        return Prompt("functions", user_input)
+
+    def get_plugin_selection_prompt(self, plugins_basic_info, user_input):
+        return Prompt("plugins", user_input)
+
+
+class FakeAIManager:
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    async def call_with_fallback(self, system_prompt, user_prompt, **kwargs):
+        self.calls += 1
+        return SelectionResponse.success_response(self.data)
+
+
+def _planner(data=json.dumps(PLAN)):
+    ai_manager = FakeAIManager(data)
+    return TaskPlanner(prompt_templates=FakeTemplates(), ai_manager=ai_manager), ai_manager
+
+
+def test_plan_execution_reuses_cached_response():
+    planner, ai_manager = _planner()
+
+    first = asyncio.run(planner.plan_execution("拍一张照片", []))
+    second = asyncio.run(planner.plan_execution("拍一张照片", []))
+
+    assert ai_manager.calls == 1
+    assert second is first
+    assert first.overall_confidence == 0.9
+
+
+def test_different_prompt_misses_cache():
+    planner, ai_manager = _planner()
+
+    asyncio.run(planner.plan_execution("拍一张照片", []))
+    asyncio.run(planner.plan_execution("录一段视频", []))
+
+    assert ai_manager.calls == 2
+
+
+def test_clear_and_expired_entries_call_ai_again():
+    planner, ai_manager = _planner()
+
+    asyncio.run(planner.plan_execution("拍一张照片", []))
+    planner.clear_response_cache()
+    asyncio.run(planner.plan_execution("拍一张照片", []))
+    planner.RESPONSE_CACHE_TTL = 0
+    asyncio.run(planner.plan_execution("拍一张照片", []))
+
+    assert ai_manager.calls == 3
+
+
+def test_single_plugin_selection_skips_ai():
+    planner, ai_manager = _planner()
+
+    selected = asyncio.run(planner.select_plugins("拍照", [{"plugin_name": "Camera", "plugin_id": "camera"}]))
+
+    assert ai_manager.calls == 0
+    assert [plugin.plugin_id for plugin in selected] == ["camera"]